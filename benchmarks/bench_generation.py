@@ -0,0 +1,204 @@
+"""Headless benchmarks for the maze generators and solvers.
+
+Runs each generator over a sweep of sizes and seeds without opening a
+turtle window and reports wall time, peak traced memory and retry counts.
+Results are written as JSON so two versions can be diffed:
+
+    python benchmarks/bench_generation.py --output before.json
+    python benchmarks/bench_generation.py --output after.json
+    python benchmarks/bench_generation.py --compare before.json after.json
+"""
+import argparse
+import functools
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from maze_core import hassan, hicham, new_wall_maze, solver  # noqa: E402
+
+
+@functools.lru_cache(maxsize=None)
+def load_game(filename):
+    """Import one of the game scripts; their windows only open from main()"""
+    name = os.path.splitext(filename)[0].replace(" ", "_")
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# === CASES ===
+# Each case returns a list of (phase, step) pairs run in order; a step gets
+# the previous step's result. Cases whose generator may carve again give
+# its Counter of "attempts" and "mazes", from which retries are reported.
+
+def hassan_case(name, stats=None):
+    def case(size):
+        return [(name, lambda _: getattr(hassan, name)(size, size))]
+    return case, stats
+
+
+def hassan_solver_case(size):
+    maze, start = hassan.generate_medium_maze(size, size)
+    rows, cols = len(maze), len(maze[0])
+    return [("is_path_available",
+             lambda _: hassan.is_path_available(maze, (1, 0), (rows - 2, cols - 1)))]
+
+
+def hicham_case(size):
+    start, goal = (0, size // 2), (size - 1, size // 2)
+    return [
+        ("carve_main_path", lambda _: hicham.carve_main_path(size, size)),
+        ("add_dead_end_branches",
+         lambda res: (hicham.add_dead_end_branches(res[0], res[1], size, size), res)[1]),
+        ("prune_wall_clusters",
+         lambda res: (hicham.prune_wall_clusters(res[0], max_adjacent=4), res)[1]),
+        ("find_path", lambda res: hicham.find_path(res[0], start, goal)),
+    ]
+
+
+def solver_case(method):
+    def case(size):
+        maze, start = hassan.generate_medium_maze(size, size)
+        rows, cols = len(maze), len(maze[0])
+        solve = solver.SOLVERS[method]
+        return [(method, lambda _: solve(maze, (1, 0), (rows - 2, cols - 1)))]
+    return case, None
+
+
+def mohamad_case(size):
+    # The game carves its module-level maze, so it is resized in place
+    game = load_game("mohamad al shami code.py")
+    game.ROWS, game.COLS = size, size
+    game.maze = new_wall_maze(size, size)
+    return [("carve_maze", lambda _: game.carve_maze(0, 0))]
+
+
+CASES = {
+    "hassan.easy": hassan_case("generate_easy_maze", hassan.easy_stats),
+    "hassan.medium": hassan_case("generate_medium_maze"),
+    "hassan.hard": hassan_case("generate_hard_maze"),
+    "hassan.solver": (hassan_solver_case, None),
+    "hicham.pipeline": (hicham_case, None),
+    "mohamad.carve": (mohamad_case, None),
+    **{"solver." + method: solver_case(method) for method in solver.SOLVERS},
+}
+
+
+def run_steps(steps, trace):
+    results = []
+    value = None
+    for phase, step in steps:
+        if trace:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        begin = time.perf_counter()
+        value = step(value)
+        elapsed = time.perf_counter() - begin
+        peak = tracemalloc.get_traced_memory()[1] - base if trace else None
+        results.append((phase, elapsed, peak))
+    return results
+
+
+def run_case(name, size, seed):
+    """Time one case, then rerun it under tracemalloc with the same seed"""
+    case, stats = CASES[name]
+    records = {}
+    for trace in (False, True):
+        random.seed(seed)
+        steps = case(size)
+        if trace:
+            tracemalloc.start()
+        try:
+            before = stats.copy() if stats is not None else None
+            measured = run_steps(steps, trace)
+            for phase, elapsed, peak in measured:
+                record = records.setdefault(phase, {
+                    "case": name, "phase": phase, "size": size, "seed": seed})
+                if trace:
+                    record["peak_bytes"] = peak
+                else:
+                    record["seconds"] = elapsed
+                    record["retries"] = (None if stats is None else
+                                         (stats["attempts"] - before["attempts"])
+                                         - (stats["mazes"] - before["mazes"]))
+        finally:
+            if trace:
+                tracemalloc.stop()
+    return list(records.values())
+
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = None
+    return {"commit": commit, "python": platform.python_version(),
+            "platform": platform.platform()}
+
+
+def compare(before_path, after_path):
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+    key = lambda r: (r["case"], r["phase"], r["size"], r["seed"])
+    old = {key(r): r for r in before["results"]}
+    print(f"{'case':<22}{'phase':<24}{'size':>6}{'seed':>6}{'time x':>10}{'mem x':>10}")
+    for record in after["results"]:
+        prev = old.get(key(record))
+        if prev is None:
+            continue
+        speed = prev["seconds"] / record["seconds"] if record["seconds"] else float("inf")
+        mem = prev["peak_bytes"] / record["peak_bytes"] if record["peak_bytes"] else float("inf")
+        print(f"{record['case']:<22}{record['phase']:<24}{record['size']:>6}"
+              f"{record['seed']:>6}{speed:>10.2f}{mem:>10.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=sorted(CASES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[21, 51, 101, 201])
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0, 1, 2])
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"),
+                        help="print speed-up and memory ratios of two result files")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+    results = []
+    for name in args.cases:
+        for size in args.sizes:
+            for seed in args.seeds:
+                for record in run_case(name, size, seed):
+                    results.append(record)
+                    print(f"{record['case']:<22}{record['phase']:<24}size={size:<6}"
+                          f"seed={seed:<4}{record['seconds'] * 1000:>10.2f} ms"
+                          f"{record['peak_bytes'] / 1024:>12.1f} KiB"
+                          + (f"  retries={record['retries']}"
+                             if record["retries"] is not None else ""), file=sys.stderr)
+
+    report = json.dumps({"meta": metadata(), "results": results}, indent=1)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 import turtle
 import time
-import random
+
+from maze_core import (Hud, KeyRepeat, Prefetcher, choose_backend, draw_raster,
+                       merge_cells, timed, to_rows)
+from maze_core.hassan import build_maze, fresh_maze
 
 
 # Global variables
@@ -12,195 +15,59 @@ button_turtles = []
 player = None
 game_won = False
 timer_started = False
-timer_display = turtle.Turtle()
+hud = None  # timer text of the current game, created by draw_timer()
 high_scores = {"Easy": None, "Medium": None, "Hard": None}
-
-# === MAZE GENERATION FUNCTIONS ===
-
-def generate_easy_maze(rows, cols):
-
-    # Ensure odd dimensions for proper maze generation
-    if rows % 2 == 0: rows += 1
-    if cols % 2 == 0: cols += 1
-
-    maze = [[1 for _ in range(cols)] for _ in range(rows)]
-
-    def carve(r, c):
-        directions = [(-2, 0), (2, 0), (0, -2), (0, 2)]
-        random.shuffle(directions)
-
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            if 0 < nr < rows and 0 < nc < cols and maze[nr][nc] == 1:
-                maze[nr][nc] = 0
-                maze[r + dr // 2][c + dc // 2] = 0
-                carve(nr, nc)
-                # Early termination sometimes to create simpler paths
-                if random.random() < 0.4:
-                    break
-
-    # Start carving near the entrance to ensure connection
-    start_row, start_col = 1, 1
-    maze[start_row][start_col] = 0
-    carve(start_row, start_col)
-
-    # Ensure exit is reachable by carving a direct path if needed
-    exit_row, exit_col = rows - 2, cols - 2
-    if maze[exit_row][exit_col] == 1:
-        # Connect exit to the nearest path
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            if maze[exit_row + dr][exit_col + dc] == 0:
-                maze[exit_row][exit_col] = 0
-                break
-
-    # Set entrance and exit
-    maze[1][0] = 0  # Entrance
-    maze[rows - 2][cols - 1] = 2  # Exit
-
-    # Final check to ensure path exists
-    if not is_path_available(maze, (1, 0), (rows - 2, cols - 1)):
-        # If not, regenerate (recursion with limit to prevent stack overflow)
-        return generate_easy_maze(rows, cols)
-
-    return maze, [1, 0]
-
-
-def generate_medium_maze(rows, cols):
-    if rows % 2 == 0: rows += 1
-    if cols % 2 == 0: cols += 1
-    maze = [[1 for _ in range(cols)] for _ in range(rows)]
-
-    def carve(r, c):
-        directions = [(-2, 0), (2, 0), (0, -2), (0, 2)]
-        random.shuffle(directions)
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            if 0 < nr < rows and 0 < nc < cols and maze[nr][nc] == 1:
-                maze[nr][nc] = 0
-                maze[r + dr // 2][c + dc // 2] = 0
-                carve(nr, nc)
-
-    carve(1, 1)
-    maze[1][0] = 0
-    maze[rows - 2][cols - 1] = 2  # Red exit square
-    return maze, [1, 0]
-
-
-def generate_hard_maze(rows, cols):
-
-    # Ensure odd dimensions
-    if rows % 2 == 0: rows += 1
-    if cols % 2 == 0: cols += 1
-
-    maze = [[1 for _ in range(cols)] for _ in range(rows)]
-
-    def carve(r, c):
-        directions = [(-2, 0), (2, 0), (0, -2), (0, 2)]
-        random.shuffle(directions)
-
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            if 0 < nr < rows and 0 < nc < cols and maze[nr][nc] == 1:
-                maze[nr][nc] = 0
-                maze[r + dr // 2][c + dc // 2] = 0
-                carve(nr, nc)
-
-    # Start carving from multiple points to create complexity
-    start_points = [(1, 1), (1, cols - 2), (rows - 2, 1), (rows - 2, cols - 2)]
-    for r, c in start_points:
-        if maze[r][c] == 1:
-            maze[r][c] = 0
-            carve(r, c)
-
-    # Add some loops but ensure solvability
-    added_walls = 0
-    for _ in range((rows * cols) // 8):  # Fewer loops than before
-        r = random.randrange(1, rows - 1)
-        c = random.randrange(1, cols - 1)
-        if maze[r][c] == 1:
-            # Only remove walls that don't completely block paths
-            neighbors = []
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                if maze[r + dr][c + dc] == 0:
-                    neighbors.append((r + dr, c + dc))
-            if len(neighbors) >= 2:
-                # Check if removing this wall would create an unsolvable maze
-                temp_maze = [row[:] for row in maze]
-                temp_maze[r][c] = 0
-                if is_path_available(temp_maze, (1, 0), (rows - 2, cols - 1)):
-                    maze[r][c] = 0
-                    added_walls += 1
-
-    # Set entrance and exit
-    maze[1][0] = 0  # Entrance
-    maze[rows - 2][cols - 1] = 2  # Exit
-
-    # Final check to ensure path exists
-    if not is_path_available(maze, (1, 0), (rows - 2, cols - 1)):
-        # If not, regenerate (recursion with limit to prevent stack overflow)
-        return generate_hard_maze(rows, cols)
-
-    return maze, [1, 0]
-
-
-def is_path_available(maze, start, end):
-    """BFS to check if path exists from start to end"""
-    rows, cols = len(maze), len(maze[0])
-    visited = [[False for _ in range(cols)] for _ in range(rows)]
-    queue = [start]
-    visited[start[0]][start[1]] = True
-
-    while queue:
-        r, c = queue.pop(0)
-
-        # Check if we've reached the exit
-        if (r, c) == end:
-            return True
-
-        # Check all four directions
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr, nc = r + dr, c + dc
-            if (0 <= nr < rows and 0 <= nc < cols and
-                    not visited[nr][nc] and maze[nr][nc] != 1):
-                visited[nr][nc] = True
-                queue.append((nr, nc))
-
-    return False
-
+maze_image = None  # PhotoImage of the raster backend, kept alive for Tk
+current_seed = None
+prefetcher = Prefetcher()  # builds the next "New Maze" in the background
+keys = None  # arrow keys of the current game, repeating while held
 
 # === DRAWING FUNCTIONS ===
 
-def draw_square(t, x, y, color, size):
+def draw_rect(t, x, y, width, height, color):
     t.penup()
     t.goto(x, y)
     t.setheading(0)
     t.fillcolor(color)
     t.begin_fill()
-    for _ in range(4):
-        t.forward(size)
+    for side in (width, height, width, height):
+        t.forward(side)
         t.right(90)
     t.end_fill()
 
 
-def draw_maze(maze, cell_size):
+def draw_square(t, x, y, color, size):
+    draw_rect(t, x, y, size, size, color)
+
+
+@timed("hassan.draw_maze")
+def draw_maze(maze, cell_size, backend="vector"):
+    global maze_image
+
+    maze = to_rows(maze)
     turtle.tracer(0, 0)
     draw = turtle.Turtle()
     draw.speed(0)
     draw.hideturtle()
 
-    start_x = -cell_size * len(maze[0]) // 2
-    start_y = cell_size * len(maze) // 2
-
-    for row in range(len(maze)):
-        for col in range(len(maze[0])):
-            x = start_x + col * cell_size
-            y = start_y - row * cell_size
-            if maze[row][col] == 1:  # Wall
-                draw_square(draw, x, y, "gray", cell_size)
-            elif maze[row][col] == 0:  # Path
-                draw_square(draw, x, y, "white", cell_size)
-            elif maze[row][col] == 2:  # Exit
-                draw_square(draw, x, y, "red", cell_size)
+    rows, cols = len(maze), len(maze[0])
+    start_x = -cell_size * cols // 2
+    start_y = cell_size * rows // 2
+
+    if backend == "raster":
+        # Whole grid as one image, the start square stays vector on top
+        maze_image = draw_raster(turtle.Screen(), maze,
+                                 {0: "white", 1: "gray", 2: "red"},
+                                 cell_size, start_x, start_y)
+    else:
+        # One white background for the paths, then walls and exit as merged
+        # rectangles instead of one filled square per cell
+        draw_rect(draw, start_x, start_y, cols * cell_size, rows * cell_size, "white")
+        for value, color in [(1, "gray"), (2, "red")]:  # Wall, Exit
+            for row, col, height, width in merge_cells(maze, value):
+                x = start_x + col * cell_size
+                y = start_y - row * cell_size
+                draw_rect(draw, x, y, width * cell_size, height * cell_size, color)
 
     # Draw player start position (green square)
     start_x_player = start_x + player_position[1] * cell_size
@@ -250,7 +117,7 @@ def move(d_row, d_col, cell_size):
             if not timer_started:
                 timer_started = True
                 start_time = time.time()
-                draw_timer()
+                update_timer()
 
             player_position = [new_row, new_col]
 
@@ -311,36 +178,30 @@ def clear_buttons():
 
 def draw_timer():
     """Initialize timer display"""
-    timer_display.hideturtle()
-    timer_display.penup()
-    timer_display.goto(0, 280)
+    global hud
+    hud = Hud(turtle.Screen())
+    hud.add("timer", 0, 280, align="center", font=("Arial", 14, "bold"))
     update_timer()
 
 
+@timed("hassan.update_timer")
 def update_timer():
     """Update the timer display"""
     if selected_difficulty and not game_won and timer_started:
         elapsed = int(time.time() - start_time)
         minutes = elapsed // 60
         seconds = elapsed % 60
-        timer_display.clear()
-        timer_display.write(f"Time: {minutes}m {seconds}s",
-                            align="center", font=("Arial", 14, "bold"))
+        # Redraws nothing unless the shown second changed
+        hud.set("timer", f"Time: {minutes}m {seconds}s")
         turtle.ontimer(update_timer, 1000)
 
 
-import winsound  # Add this at the top with other imports
-
-
 def player_won():
     """Handle win condition"""
     global game_won, high_scores
 
     game_won = True
-    turtle.onkey(None, "Up")
-    turtle.onkey(None, "Down")
-    turtle.onkey(None, "Left")
-    turtle.onkey(None, "Right")
+    keys.stop()
 
     elapsed = int(time.time() - start_time)
 
@@ -414,10 +275,15 @@ def draw_high_score():
 
 # === GAME CONTROL FUNCTIONS ===
 
-def start_game(difficulty):
-    """Initialize or restart the game"""
+def start_game(difficulty, backend="auto", seed=None):
+    """Initialize or restart the game
+
+    backend is "vector", "raster" or "auto" (raster for very large mazes).
+    The same seed always gives the same maze, loaded from the cache after
+    the first time; without one a fresh, uncached seed is drawn.
+    """
     global current_maze, player_position, player, selected_difficulty
-    global game_won, timer_started
+    global game_won, timer_started, current_seed, keys
 
     # Reset game state
     selected_difficulty = difficulty
@@ -427,6 +293,8 @@ def start_game(difficulty):
     # Clear previous elements
     if player is not None:
         player.hideturtle()
+    if keys is not None:
+        keys.stop()
     turtle.clearscreen()
     turtle.bgcolor("white")
     turtle.title("Maze Game")
@@ -445,16 +313,19 @@ def start_game(difficulty):
     # Set window size
     turtle.setup(width=800, height=800)
 
-    # Generate maze
-    if difficulty == "Easy":
-        current_maze, player_position = generate_easy_maze(rows, cols)
-    elif difficulty == "Medium":
-        current_maze, player_position = generate_medium_maze(rows, cols)
+    # Generate maze; without a seed, use the one prefetched last time
+    if seed is None:
+        seed, current_maze, solution = prefetcher.take(
+            difficulty, lambda: fresh_maze(difficulty, rows, cols))
     else:
-        current_maze, player_position = generate_hard_maze(rows, cols)
+        current_maze, solution = build_maze(difficulty, rows, cols, seed)
+    current_seed = seed
+    player_position = list(solution[0])
+    turtle.title(f"Maze Game - seed {seed}")
 
     # Draw game elements
-    draw_maze(current_maze, cell_size)
+    draw_maze(current_maze, cell_size,
+              choose_backend(backend, len(current_maze), len(current_maze[0])))
     setup_player(cell_size)
 
     # Create control buttons
@@ -466,7 +337,7 @@ def start_game(difficulty):
 
     # New Maze button
     create_button("New Maze", 0, maze_bottom - 50, "blue",
-                  lambda: start_game(difficulty))
+                  lambda: start_game(difficulty, backend))
 
     # Difficulty switcher buttons
     other_diffs = [d for d in ["Easy", "Medium", "Hard"] if d != difficulty]
@@ -474,14 +345,18 @@ def start_game(difficulty):
     for i, level in enumerate(other_diffs):
         x_pos = -100 + (i * 200)
         create_button(level, x_pos, maze_bottom - 100, colors[level],
-                      lambda l=level: start_game(l))
+                      lambda l=level: start_game(l, backend))
+
+    # Build the next "New Maze" while this one is played
+    prefetcher.prefetch(difficulty, lambda: fresh_maze(difficulty, rows, cols))
 
     # Set up controls
+    keys = KeyRepeat(turtle.Screen(), 150)
     turtle.listen()
-    turtle.onkey(lambda: move(-1, 0, cell_size), "Up")
-    turtle.onkey(lambda: move(1, 0, cell_size), "Down")
-    turtle.onkey(lambda: move(0, -1, cell_size), "Left")
-    turtle.onkey(lambda: move(0, 1, cell_size), "Right")
+    keys.bind("Up", lambda: move(-1, 0, cell_size))
+    keys.bind("Down", lambda: move(1, 0, cell_size))
+    keys.bind("Left", lambda: move(0, -1, cell_size))
+    keys.bind("Right", lambda: move(0, 1, cell_size))
 
     # Initialize timer
     draw_timer()
@@ -514,5 +389,6 @@ def draw_main_menu():
 
 
 # === START THE GAME ===
-draw_main_menu()
-turtle.mainloop()
+if __name__ == "__main__":
+    draw_main_menu()
+    turtle.mainloop()
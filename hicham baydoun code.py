@@ -1,202 +1,153 @@
+import sys
 import turtle
 import random
-import time
-import winsound
-from collections import deque
+try:
+    import winsound
+except ImportError:  # sounds are Windows-only, elsewhere the game is silent
+    winsound = None
+
+from maze_core import (ChunkedWorld, Hud, KeyRepeat, Prefetcher, Tweener, Viewport,
+                       choose_backend, distance_field, draw_raster_outlines,
+                       outline_segments, path_to_goal, span, to_rows)
+from maze_core.hicham import (IDEAL_BONUS, STARTING_SCORE, build_level,
+                              can_move, level_size, settle_score)
 
 cell_size = 20
-initial_maze_width = 21
-initial_maze_height = 21
-maze_increment = 2
 level = 0
 screen_width_limit = int(1920 * 0.8)
 screen_height_limit = int(1080 * 0.8)
 max_maze_width = (screen_width_limit - 40) // cell_size
 max_maze_height = (screen_height_limit - 40) // cell_size
+zoom_levels = (0.5, 1, 2)
 pixels_per_second = (20 * 5280 * 100) / 3600
 frame_interval = 0.01
-pixels_per_frame = pixels_per_second * frame_interval
-total_score = 20
-
-def carve_main_path(width, height):
-    grid = [[0] * width for _ in range(height)]
-    start = (0, height // 2)
-    goal  = (width - 1, height // 2)
-    visited = {start}
-    path = [start]
-    grid[start[1]][start[0]] = 1
-    while path:
-        x, y = path[-1]
-        if (x, y) == goal:
-            break
-        neighbors = []
-        for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-            nx, ny = x+dx, y+dy
-            if 0<=nx<width and 0<=ny<height and (nx,ny) not in visited:
-                neighbors.append((nx,ny,dx//2,dy//2))
-        if not neighbors:
-            path.pop()
-        else:
-            nx,ny,wx,wy = random.choice(neighbors)
-            grid[y+wy][x+wx] = 1
-            grid[ny][nx]     = 1
-            visited.add((nx,ny))
-            path.append((nx,ny))
-    return grid, path
-
-def add_dead_end_branches(grid, main_path, width, height, max_branches_per_cell=3, branch_len=(3,8)):
-    dirs = [(-2,0),(2,0),(0,-2),(0,2)]
-    for cx,cy in main_path:
-        for _ in range(random.randint(1, max_branches_per_cell)):
-            dx,dy = random.choice(dirs)
-            x,y   = cx,cy
-            carve_list = []
-            for _ in range(random.randint(*branch_len)):
-                nx,ny = x+dx, y+dy
-                wx,wy = x+dx//2, y+dy//2
-                if not (0<=nx<width and 0<=ny<height):
-                    break
-                if grid[wy][wx]==0 and grid[ny][nx]==0:
-                    carve_list += [(wy,wx),(ny,nx)]
-                    x,y = nx,ny
-                else:
-                    break
-            for ry,rx in carve_list:
-                grid[ry][rx] = 1
-
-def find_path(grid, start, goal):
-    W,H = len(grid[0]), len(grid)
-    q = deque([start])
-    parent = {start:None}
-    while q:
-        x,y = q.popleft()
-        if (x,y)==goal: break
-        for dx,dy in [(1,0),(-1,0),(0,1),(0,-1)]:
-            nx,ny = x+dx,y+dy
-            if 0<=nx<W and 0<=ny<H and grid[ny][nx]==1 and (nx,ny) not in parent:
-                parent[(nx,ny)] = (x,y)
-                q.append((nx,ny))
-    path,cur = [], goal
-    while cur:
-        path.append(cur)
-        cur = parent[cur]
-    return list(reversed(path))
-
-def prune_wall_clusters(grid, max_adjacent=4):
-    H,W = len(grid), len(grid[0])
-    deltas = [(-1,-1),(-1,0),(-1,1),(0,-1),(0,1),(1,-1),(1,0),(1,1)]
-    changed = True
-    while changed:
-        changed = False
-        for y in range(H):
-            for x in range(W):
-                if grid[y][x]!=0: continue
-                nbrs = [(y+dy,x+dx) for dy,dx in deltas
-                        if 0<=y+dy<H and 0<=x+dx<W and grid[y+dy][x+dx]==0]
-                if len(nbrs)>max_adjacent:
-                    ry,rx = random.choice(nbrs)
-                    grid[ry][rx] = 1
-                    changed = True
+total_score = STARTING_SCORE
+run_seed = random.randrange(2**32)  # level n of this run always uses run_seed+n; see new_run
+prefetcher = Prefetcher()
+view = None  # camera of the current level
+tweener = None  # animates the player of the current level
+endless_chunk_rows = 2  # the endless world is this many chunks tall
+
+def new_run(first_level=0):
+    """Start a fresh run: full score and new mazes from a new seed"""
+    global level, total_score, run_seed
+    level = first_level
+    total_score = STARTING_SCORE
+    run_seed = random.randrange(2**32)
 
 def highlight_path(t, path_cells, width, height):
     if not path_cells: return
     t.hideturtle(); t.penup(); t.color("limegreen"); t.pensize(3)
-    sx = -width*cell_size//2; sy = height*cell_size//2
-    
-    def to_screen(x,y):
-        return (sx + x*cell_size + cell_size//2,
-                sy - y*cell_size - cell_size//2)
-    t.goto(*to_screen(*path_cells[0])); t.pendown()
+    t.goto(*grid_to_screen(*path_cells[0], width, height)); t.pendown()
     for x,y in path_cells[1:]:
-        t.goto(*to_screen(x,y))
+        t.goto(*grid_to_screen(x, y, width, height))
     t.penup()
 
-def is_in_bounds(x, y, width, height):
-    return 0<=x<width and 0<=y<height
+def grid_corner(gx, gy, width, height):
+    return view.to_screen(gy, gx)
+
+def grid_to_screen(gx, gy, width, height):
+    return view.center(gy, gx)
 
-def draw_maze(t, grid, width, height):
+def draw_maze(t, grid, width, height, x0=0, y0=0, x1=None, y1=None, to_screen=None,
+              raster=False):
+    # to_screen(row, col): corner of a cell, given by the viewport drawing a tile
+    corner = (lambda gx, gy: to_screen(gy, gx)) if to_screen else \
+             (lambda gx, gy: grid_corner(gx, gy, width, height))
     t.hideturtle(); t.penup(); t.pensize(2)
-    sx = -width*cell_size//2; sy = height*cell_size//2
-    for y in range(height):
-        for x in range(width):
-            if grid[y][x]==0:
-                px,py = sx+x*cell_size, sy-y*cell_size
-                t.goto(px,py); t.pendown()
-                for _ in range(4):
-                    t.forward(cell_size); t.right(90)
-                t.penup()
+    rows = [row[x0:x1] for row in to_rows(grid)[y0:y1]]
+    if raster:
+        # The same outlines as one image, not one canvas line per wall edge
+        (ax,ay),(bx,_) = corner(x0, y0), corner(x0+1, y0)
+        draw_raster_outlines(t, rows, 0, bx-ax, ax, ay)
+        return
+    # Shared wall edges are drawn once and collinear edges as one line
+    for (ax,ay),(bx,by) in outline_segments(rows, 0):
+        t.goto(*corner(x0+ax, y0+ay)); t.pendown()
+        t.goto(*corner(x0+bx, y0+by)); t.penup()
+
+def draw_border(view_w, view_h):
+    border = turtle.Turtle()
+    border.hideturtle(); border.pensize(3); border.color("red"); border.penup()
+    px,py = view_w*cell_size, view_h*cell_size
+    border.goto(-px//2, py//2); border.pendown()
+    for dx,dy in [(px,0),(0,-py),(-px,0),(0,py)]:
+        border.goto(border.xcor()+dx, border.ycor()+dy)
+    return border
 
 def move_to_grid(t, gx, gy, width, height):
-    sx = -width*cell_size//2 + gx*cell_size + cell_size//2
-    sy =  height*cell_size//2 - gy*cell_size - cell_size//2
-    t.goto(sx,sy)
-
-def can_move(x, y, grid, width, height):
-    return is_in_bounds(x,y,width,height) and grid[y][x]==1
-
-def animate_move_to_grid(t, gx, gy, width, height):
-    sx = -width*cell_size//2 + gx*cell_size + cell_size//2
-    sy =  height*cell_size//2 - gy*cell_size - cell_size//2
-    dx,dy = sx-t.xcor(), sy-t.ycor()
-    dist = (dx*dx+dy*dy)**0.5
-    steps = max(int(dist/pixels_per_frame),1)
-    dx/=steps; dy/=steps
-    for _ in range(steps):
-        t.setx(t.xcor()+dx); t.sety(t.ycor()+dy)
-        turtle.update(); time.sleep(frame_interval)
-
-def main():
-    global level, screen, total_score
+    t.goto(*grid_to_screen(gx, gy, width, height))
+
+def animate_move_to_grid(t, gx, gy, width, height, done=None):
+    # Queued behind any running move; the target follows viewport scrolling
+    tweener.move(t, lambda: grid_to_screen(gx, gy, width, height), done)
+
+def main(backend="auto"):
+    global level, screen, total_score, view, tweener
     level += 1
-    maze_width  = min(initial_maze_width  + level*maze_increment, max_maze_width)
-    maze_height = min(initial_maze_height + level*maze_increment, max_maze_height)
+    maze_width, maze_height = level_size(level)
+    # The window shows at most max_maze_width x max_maze_height cells
+    view_w, view_h = min(maze_width, max_maze_width), min(maze_height, max_maze_height)
     screen = turtle.Screen()
-    screen.setup(width=maze_width*cell_size+40, height=maze_height*cell_size+80)
+    screen.setup(width=view_w*cell_size+40, height=view_h*cell_size+80)
     screen.title(f"Turtle Maze — Level {level}")
     screen.bgcolor("white")
     screen.tracer(0,0)
-    grid, main_path = carve_main_path(maze_width, maze_height)
-    add_dead_end_branches(grid, main_path, maze_width, maze_height)
-    prune_wall_clusters(grid, max_adjacent=4)
     start = (0, maze_height//2)
     goal  = (maze_width-1, maze_height//2)
-    solution = find_path(grid, start, goal)
+    # Normally ready already: it was built in the background last level
+    grid, solution = prefetcher.take((run_seed, level), lambda: build_level(level, run_seed+level))
+    # Distance to the goal from every cell, so scoring and hints never search
+    dist = distance_field(grid, (goal[1], goal[0]), wall=0)
+
+    def route_from(x, y):
+        return [(c,r) for r,c in path_to_goal(dist, maze_height, maze_width, (y,x))]
     ideal_moves = len(solution)-1
     game_score  = ideal_moves
+    remaining   = ideal_moves
     moves_taken = 0
-    status_t    = turtle.Turtle(visible=False)
-    status_t.penup()
-    status_t.goto(-maze_width*cell_size//2+10, maze_height*cell_size//2+10)
+    # One persistent text item, edited in place instead of rewritten per move
+    hud = Hud(screen)
+    hud.add("status", -view_w*cell_size//2+10, view_h*cell_size//2+10, font=("Arial",14,"normal"))
 
     def update_status():
-        status_t.clear()
-        status_t.write(f"Total: {total_score}   Moves left: {game_score}",align="left", font=("Arial",14,"normal"))
+        with span("hicham.update_status"):
+            hud.set("status", f"Total: {total_score}   Moves left: {game_score}   Optimal from here: {remaining}")
     update_status()
+    # Raster tiles for big mazes, by size whether or not the level fits
+    raster = choose_backend(backend, maze_height, maze_width) == "raster"
+    # Only the cells in the window are drawn, so big levels cost no more
+    view = Viewport(screen, maze_height, maze_width, view_w*cell_size, view_h*cell_size,
+                    -view_w*cell_size//2, view_h*cell_size//2, cell_size,
+                    lambda t,r0,c0,r1,c1,to_screen: draw_maze(t, grid, maze_width, maze_height,
+                                                              c0, r0, c1, r1, to_screen, raster),
+                    zoom_levels=zoom_levels, mask="white")
+    view.overlay(hud)
     highlighter = turtle.Turtle()
     highlight_path(highlighter, solution, maze_width, maze_height)
-    drawer = turtle.Turtle()
-    draw_maze(drawer, grid, maze_width, maze_height)
-    border = turtle.Turtle()
-    border.hideturtle(); border.pensize(3); border.color("red"); border.penup()
-    px,py = maze_width*cell_size, maze_height*cell_size
-    border.goto(-px//2, py//2); border.pendown()
-    for dx,dy in [(px,0),(0,-py),(-px,0),(0,py)]:
-        border.goto(border.xcor()+dx, border.ycor()+dy)
+    border = draw_border(view_w, view_h)
+    buttons = turtle.Turtle(visible=False)
+    buttons.penup()
     for label, xpos in [("Reset", -200), ("Easy", -100), ("Medium", 100), ("Hard", 200)]:
-        btn = turtle.Turtle(visible=False)
-        btn.penup()
-        btn.goto(xpos, -maze_height * cell_size // 2 - 60)
-        btn.write(label, align="center", font=("Arial", 14, "bold"))
+        buttons.goto(xpos, -view_h * cell_size // 2 - 60)
+        buttons.write(label, align="center", font=("Arial", 14, "bold"))
+    buttons.goto(0, -view_h * cell_size // 2 - 30)
+    buttons.write("WASD: move   H: hint   +/-: zoom   B: vector/raster   E: endless mode",
+                  align="center", font=("Arial", 10, "normal"))
+    stamps = turtle.Turtle(visible=False)
+    stamps.penup()
 
     def stamp(shape, color, cell):
-        t = turtle.Turtle(visible=False)
-        t.penup(); t.shape(shape); t.color(color)
-        move_to_grid(t, cell[0], cell[1], maze_width, maze_height)
-        t.stamp()
+        stamps.shape(shape); stamps.color(color)
+        move_to_grid(stamps, cell[0], cell[1], maze_width, maze_height)
+        stamps.stamp()
     stamp("circle","green", start)
     stamp("square","red",   goal)
     screen.update()
-    screen.tracer(1,10)
+    # From here the tweener redraws the screen once per animation frame
+    tweener = Tweener(screen, pixels_per_second, int(frame_interval*1000))
+    # Build the next level while this one is played, so "Next Maze" is instant
+    prefetcher.prefetch((run_seed, level+1), lambda n=level+1: build_level(n, run_seed+n))
     player = turtle.Turtle("turtle")
     player.color("blue"); player.pensize(3)
     player.penup(); player.speed(0)
@@ -206,11 +157,17 @@ def main():
     message_drawn = False
     btn = turtle.Turtle(visible=False)
     btn.penup()
-    btn.goto(0, -maze_height*cell_size//2 - 60)
+    btn.goto(0, -view_h*cell_size//2 - 60)
     btn.write("Next Maze", align="center", font=("Arial",14,"bold"))
+    # The maze, its overlays and the player scroll; the HUD stays put
+    for t in (highlighter, stamps, player):
+        view.anchor(t)
+    for t in (border, buttons, btn):
+        view.overlay(t)
+    view.follow(player_y, player_x)
 
     def move(dx, dy, heading):
-        nonlocal player_x, player_y, message_drawn, game_score, moves_taken
+        nonlocal player_x, player_y, message_drawn, game_score, moves_taken, remaining
         global total_score
         nx,ny = player_x+dx, player_y+dy
         if can_move(nx,ny,grid,maze_width,maze_height):
@@ -219,125 +176,241 @@ def main():
             player.pendown()
             moves_taken += 1
             game_score  -= 1
+            remaining    = dist[ny*maze_width + nx]
             update_status()
-            animate_move_to_grid(player, nx, ny, maze_width, maze_height)
+            view.follow(ny, nx)
+            arrived = None
             if (nx,ny)==goal and not message_drawn:
-                winsound.PlaySound(None, winsound.SND_PURGE)
-                if game_score==0:
-                    total_score += 20
-                elif game_score<0:
-                    total_score -= -game_score
-                if total_score >= 0:
-                    winsound.PlaySound("drums-audiomass-output.wav", winsound.SND_ALIAS|winsound.SND_ASYNC)
-                if total_score <= 0:
-                    btn.clear()
-                    box = turtle.Turtle(visible=False)
-                    box.penup()
-                    box.goto(-200, 80)
-                    box.pendown()
-                    box.pencolor("red")
-                    box.fillcolor("white")
-                    box.begin_fill()
-                    for _ in range(2):
-                        box.forward(400)
-                        box.right(90)
-                        box.forward(240)
-                        box.right(90)
-                    box.end_fill()
-                    box.penup()
-                    popup = turtle.Turtle(visible=False)
-                    popup.penup()
-                    popup.goto(0,  40)
-                    popup.color("red")
-                    popup.write("GAME OVER", align="center", font=("Arial",24,"bold"))
-                    popup.color("black")
-                    stats = [
-                        f"Level reached: {level}",
-                        f"Ideal moves  : {ideal_moves}",
-                        f"Moves taken  : {moves_taken}",
-                        f"Total Score  : {total_score}"
-                    ]
-                    y = 0
-                    winsound.PlaySound(
-                        "audiomass-output.wav",
-                        winsound.SND_FILENAME | winsound.SND_ASYNC
-                    )
-                    for line in stats:
-                        popup.goto(0, y)
-                        popup.write(line, align="center", font=("Arial",16,"normal"))
-                        y -= 30
-
-                    popup.goto(0, y - 20)
-                    popup.color("blue")
-                    popup.write("Play Again", align="center", font=("Arial",18,"bold"))
-                else:
-                    w = turtle.Turtle(visible=False)
-                    w.penup()
-                    w.color("green")
-                    w.goto(0, -maze_height*cell_size//2 - 30)
-                    if game_score == 0:
-                        msg = f"Ideal used! +20 → Total: {total_score}"
-                    else:
-                        pen = -game_score
-                        msg = f"Overshot {pen} moves. -{pen} → Total: {total_score}"
-                    w.write(msg, align="center", font=("Arial",16,"bold"))
                 message_drawn = True
+                arrived = lambda score=game_score: reach_goal(score)
+            animate_move_to_grid(player, nx, ny, maze_width, maze_height, arrived)
+
+    def reach_goal(game_score):
+        global total_score
+        if winsound:
+            winsound.PlaySound(None, winsound.SND_PURGE)
+        total_score = settle_score(total_score, game_score)
+        if total_score >= 0 and winsound:
+            winsound.PlaySound("drums-audiomass-output.wav", winsound.SND_ALIAS|winsound.SND_ASYNC)
+        if total_score <= 0:
+            btn.clear()
+            box = turtle.Turtle(visible=False)
+            box.penup()
+            box.goto(-200, 80)
+            box.pendown()
+            box.pencolor("red")
+            box.fillcolor("white")
+            box.begin_fill()
+            for _ in range(2):
+                box.forward(400)
+                box.right(90)
+                box.forward(240)
+                box.right(90)
+            box.end_fill()
+            box.penup()
+            popup = turtle.Turtle(visible=False)
+            popup.penup()
+            popup.goto(0,  40)
+            popup.color("red")
+            popup.write("GAME OVER", align="center", font=("Arial",24,"bold"))
+            popup.color("black")
+            stats = [
+                f"Level reached: {level}",
+                f"Ideal moves  : {ideal_moves}",
+                f"Moves taken  : {moves_taken}",
+                f"Total Score  : {total_score}"
+            ]
+            y = 0
+            if winsound:
+                winsound.PlaySound(
+                    "audiomass-output.wav",
+                    winsound.SND_FILENAME | winsound.SND_ASYNC
+                )
+            for line in stats:
+                popup.goto(0, y)
+                popup.write(line, align="center", font=("Arial",16,"normal"))
+                y -= 30
+
+            popup.goto(0, y - 20)
+            popup.color("blue")
+            popup.write("Play Again", align="center", font=("Arial",18,"bold"))
+        else:
+            w = turtle.Turtle(visible=False)
+            w.penup()
+            w.color("green")
+            w.goto(0, -view_h*cell_size//2 - 30)
+            if game_score == 0:
+                msg = f"Ideal used! +{IDEAL_BONUS} → Total: {total_score}"
+            else:
+                pen = -game_score
+                msg = f"Overshot {pen} moves. -{pen} → Total: {total_score}"
+            w.write(msg, align="center", font=("Arial",16,"bold"))
 
-    def game_loop():
-        if flags["up"]:
-            move(0, 1, 270)
-        elif flags["down"]:
-            move(0, -1, 90)
-        elif flags["left"]:
-            move(-1, 0, 180)
-        elif flags["right"]:
-            move(1, 0, 0)
-        screen.ontimer(game_loop, int(frame_interval*1000))
-    flags = {"up":False,"down":False,"left":False,"right":False}
+    def show_hint():
+        highlighter.clear()
+        highlight_path(highlighter, route_from(player_x, player_y), maze_width, maze_height)
+        screen.update()
+
+    def step(dx, dy, heading):
+        # Keep one move chained behind the running one, not a backlog
+        if tweener.pending(player) < 2:
+            move(dx, dy, heading)
+    # Repeats about once per cell glide, and only while a key is held
+    keys = KeyRepeat(screen, int(cell_size/pixels_per_second*1000))
     screen.listen()
-    screen.onkeypress(lambda: flags.update(up=True),    "s")
-    screen.onkeyrelease(lambda: flags.update(up=False), "s")
-    screen.onkeypress(lambda: flags.update(down=True),  "w")
-    screen.onkeyrelease(lambda: flags.update(down=False),"w")
-    screen.onkeypress(lambda: flags.update(left=True),  "a")
-    screen.onkeyrelease(lambda: flags.update(left=False),"a")
-    screen.onkeypress(lambda: flags.update(right=True), "d")
-    screen.onkeyrelease(lambda: flags.update(right=False),"d")
+    keys.bind("s", lambda: step(0, 1, 270))
+    keys.bind("w", lambda: step(0, -1, 90))
+    keys.bind("a", lambda: step(-1, 0, 180))
+    keys.bind("d", lambda: step(1, 0, 0))
+    screen.onkey(show_hint, "h")
+
+    def start_endless():
+        tweener.cancel(); keys.stop()
+        screen.clearscreen()
+        endless(backend)
+    screen.onkey(start_endless, "e")
+
+    def switch_backend():
+        global level
+        tweener.cancel(); keys.stop()
+        screen.clearscreen()
+        level -= 1  # the same level again, like Reset
+        main("vector" if raster else "raster")
+    screen.onkey(switch_backend, "b")
+    screen.onkey(view.zoom_in,  "plus")
+    screen.onkey(view.zoom_in,  "equal")
+    screen.onkey(view.zoom_out, "minus")
 
     def click_handler(x, y):
-        global total_score, level
+        global level
         if total_score > 0 and -60 < x < 60 and \
-                -maze_height * cell_size // 2 - 80 < y < -maze_height * cell_size // 2 - 40:
+                -view_h * cell_size // 2 - 80 < y < -view_h * cell_size // 2 - 40:
+            tweener.cancel(); keys.stop()
             screen.clearscreen()
-            main()
+            main(backend)
         if total_score <= 0 and abs(x) < 100 and -160 < y < -120:
-            level = 0
-            total_score = 20
+            new_run()
+            tweener.cancel(); keys.stop()
             screen.clearscreen()
-            main()
-        if -220 < x < -180 and -maze_height * cell_size // 2 - 80 < y < -maze_height * cell_size // 2 - 40:
+            main(backend)
+        if -220 < x < -180 and -view_h * cell_size // 2 - 80 < y < -view_h * cell_size // 2 - 40:
+            tweener.cancel(); keys.stop()
             screen.clearscreen()
             level -= 1
-            main()
-        if -120 < x < -80 and -maze_height * cell_size // 2 - 80 < y < -maze_height * cell_size // 2 - 40:
-            level = 0
-            total_score = 20
+            main(backend)
+        if -120 < x < -80 and -view_h * cell_size // 2 - 80 < y < -view_h * cell_size // 2 - 40:
+            new_run()
+            tweener.cancel(); keys.stop()
             screen.clearscreen()
-            main()
-        if 80 < x < 120 and -maze_height * cell_size // 2 - 80 < y < -maze_height * cell_size // 2 - 40:
-            level = 9
-            total_score = 20
+            main(backend)
+        if 80 < x < 120 and -view_h * cell_size // 2 - 80 < y < -view_h * cell_size // 2 - 40:
+            new_run(9)
+            tweener.cancel(); keys.stop()
             screen.clearscreen()
-            main()
-        if 180 < x < 220 and -maze_height * cell_size // 2 - 80 < y < -maze_height * cell_size // 2 - 40:
-            level = 14
-            total_score = 20
+            main(backend)
+        if 180 < x < 220 and -view_h * cell_size // 2 - 80 < y < -view_h * cell_size // 2 - 40:
+            new_run(14)
+            tweener.cancel(); keys.stop()
             screen.clearscreen()
-            main()
+            main(backend)
 
     screen.onclick(click_handler)
-    game_loop()
+    turtle.done()
+
+def endless(backend="auto"):
+    """Endless mode: a maze band that grows to the right as the player goes"""
+    global screen, view, tweener
+    world = ChunkedWorld(run_seed)
+    # A band of whole chunks plus the top wall of the next chunk row; the
+    # columns never run out, only the tiles in the window are ever drawn
+    maze_height = endless_chunk_rows*world.size + 1
+    maze_width  = 10**9
+    view_w, view_h = max_maze_width, min(maze_height, max_maze_height)
+    screen = turtle.Screen()
+    screen.setup(width=view_w*cell_size+40, height=view_h*cell_size+80)
+    screen.title("Turtle Maze — Endless")
+    screen.bgcolor("white")
+    screen.tracer(0,0)
+
+    def is_open(x, y):
+        # The band's outer rows and first column stay closed
+        return 0 < y < maze_height-1 and x > 0 and world.is_open(y, x)
+
+    raster = choose_backend(backend, maze_height, maze_width) == "raster"
+
+    def draw_tile(t, r0, c0, r1, c1, to_screen):
+        # Tiles and chunks need not line up; cells come from the world
+        cells = [[int(is_open(x, y)) for x in range(c0, c1)] for y in range(r0, r1)]
+        draw_maze(t, cells, c1-c0, r1-r0, to_screen=lambda r, c: to_screen(r0+r, c0+c),
+                  raster=raster)
+
+    hud = Hud(screen)
+    hud.add("status", -view_w*cell_size//2+10, view_h*cell_size//2+10, font=("Arial",14,"normal"))
+    view = Viewport(screen, maze_height, maze_width, view_w*cell_size, view_h*cell_size,
+                    -view_w*cell_size//2, view_h*cell_size//2, cell_size, draw_tile,
+                    zoom_levels=zoom_levels, mask="white")
+    view.overlay(hud)
+    border = draw_border(view_w, view_h)
+    hint = turtle.Turtle(visible=False)
+    hint.penup()
+    hint.goto(0, -view_h*cell_size//2 - 60)
+    hint.write("Esc: back to the levels", align="center", font=("Arial",14,"bold"))
+    for t in (border, hint):
+        view.overlay(t)
+    tweener = Tweener(screen, pixels_per_second, int(frame_interval*1000))
+    player = turtle.Turtle("turtle")
+    player.color("blue"); player.pensize(3)
+    player.penup(); player.speed(0)
+    player_x, player_y = 1, 1  # chunk cells are carved from their (1, 1)
+    move_to_grid(player, player_x, player_y, maze_width, maze_height)
+    # No trail: it would add canvas items without bound as the band grows
+    view.anchor(player)
+    view.follow(player_y, player_x)
+    moves_taken = 0
+    furthest = player_x
+
+    def update_status():
+        hud.set("status", f"Distance: {furthest}   Moves: {moves_taken}   "
+                          f"Chunks built: {world.generated}")
+    update_status()
+    screen.update()
+
+    def move(dx, dy, heading):
+        nonlocal player_x, player_y, moves_taken, furthest
+        nx,ny = player_x+dx, player_y+dy
+        if not is_open(nx, ny):
+            return
+        player.setheading(heading)
+        player_x,player_y = nx,ny
+        moves_taken += 1
+        furthest = max(furthest, nx)
+        # Neighbouring chunks are built before they can scroll into view
+        world.preload(ny, nx)
+        update_status()
+        view.follow(ny, nx)
+        animate_move_to_grid(player, nx, ny, maze_width, maze_height)
+
+    def step(dx, dy, heading):
+        if tweener.pending(player) < 2:
+            move(dx, dy, heading)
+    keys = KeyRepeat(screen, int(cell_size/pixels_per_second*1000))
+    screen.listen()
+    keys.bind("s", lambda: step(0, 1, 270))
+    keys.bind("w", lambda: step(0, -1, 90))
+    keys.bind("a", lambda: step(-1, 0, 180))
+    keys.bind("d", lambda: step(1, 0, 0))
+    screen.onkey(view.zoom_in,  "plus")
+    screen.onkey(view.zoom_in,  "equal")
+    screen.onkey(view.zoom_out, "minus")
+
+    def back_to_levels():
+        new_run()
+        tweener.cancel(); keys.stop()
+        screen.clearscreen()
+        main(backend)
+    screen.onkey(back_to_levels, "Escape")
     turtle.done()
 
 if __name__ == "__main__":
-    main()
+    # Drawing backend: vector, raster or auto (raster for big mazes)
+    main(sys.argv[1] if len(sys.argv) > 1 else "auto")
@@ -0,0 +1,24 @@
+"""Shared maze engine used by the three turtle games."""
+
+from maze_core.carving import carve_grid, carve_passages
+from maze_core.connectivity import DisjointSet, grid_sets
+from maze_core.grid import (count_neighbours, is_array, new_grid, row_views,
+                            to_array, to_rows)
+from maze_core.walls import (ALL_WALLS, VISITED, carve_wall_maze, has_wall,
+                             new_wall_maze, solve_wall_maze)
+from maze_core.geometry import merge_cells, outline_segments, wall_segments
+from maze_core.raster import (RASTER_THRESHOLD, choose_backend, draw_raster,
+                              draw_raster_outlines)
+from maze_core.distance import distance_field, next_step, path_to_goal
+from maze_core.cache import cache_key, cached
+from maze_core.prefetch import Prefetcher
+from maze_core.mazefile import MazeFile, write_maze, write_wall_maze
+from maze_core.streaming import eller, stream_grid, stream_wall_rows, write_streamed
+from maze_core.world import ChunkedWorld
+from maze_core.viewport import Viewport
+from maze_core.tween import Tweener
+from maze_core.keys import KeyRepeat
+from maze_core.instrument import span, timed
+from maze_core.hud import Hud
+from maze_core.solver import astar, bfs, bidirectional_bfs, dead_end_fill, solve_many
+from maze_core.analysis import analyze, cached_analysis, rank
@@ -0,0 +1,84 @@
+"""Measure how hard a generated maze is, in one pass over its cells.
+
+analyze() runs a single BFS from the start over a flat copy of the grid
+(see maze_core.solver) and, while visiting each reachable cell, counts
+its open neighbours. That gives every metric at once:
+
+    solution_length     moves on the shortest route, -1 when unsolvable
+    dead_ends           reachable cells with one open neighbour, not
+                        counting the start and goal
+    junctions           reachable cells with three or more
+    branching           mean choices onward (degree - 1) at a junction
+    loops               independent cycles: edges - cells + 1
+    reachable_fraction  share of open cells reachable from the start
+"""
+
+from maze_core.cache import cache_key, load_metrics, store_metrics
+from maze_core.solver import flatten
+
+
+def analyze(grid, start, goal, wall=1):
+    """Difficulty metrics of grid between start and goal, both (row, col)"""
+    cells, width = flatten(grid, wall)
+    open_cells = cells.count(1)
+    s = (start[0] + 1) * width + start[1] + 1
+    g = (goal[0] + 1) * width + goal[1] + 1
+    metrics = {"solution_length": -1, "dead_ends": 0, "junctions": 0,
+               "branching": 0.0, "loops": 0, "reachable_fraction": 0.0}
+    if not cells[s]:
+        return metrics
+    seen = bytearray(len(cells))
+    seen[s] = 1
+    frontier, distance = [s], 0
+    reached = degrees = dead_ends = junctions = choices = 0
+    while frontier:
+        nxt = []
+        for i in frontier:
+            if i == g:
+                metrics["solution_length"] = distance
+            degree = 0
+            for j in (i - width, i + width, i - 1, i + 1):
+                if cells[j]:
+                    degree += 1
+                    if not seen[j]:
+                        seen[j] = 1
+                        nxt.append(j)
+            degrees += degree
+            if degree == 1 and i != s and i != g:
+                dead_ends += 1
+            elif degree >= 3:
+                junctions += 1
+                choices += degree - 1
+        reached += len(frontier)
+        frontier, distance = nxt, distance + 1
+    metrics.update(dead_ends=dead_ends, junctions=junctions,
+                   branching=choices / junctions if junctions else 0.0,
+                   loops=degrees // 2 - reached + 1,
+                   reachable_fraction=reached / open_cells)
+    return metrics
+
+
+def cached_analysis(generator, dims, seed, grid, start, goal, wall=1,
+                    cache_dir=None, **params):
+    """analyze(), stored next to the cached maze with the same key"""
+    key = cache_key(generator, dims, seed, **params)
+    metrics = load_metrics(key, cache_dir)
+    if metrics is None:
+        metrics = analyze(grid, start, goal, wall)
+        try:
+            store_metrics(key, metrics, cache_dir)
+        except OSError:
+            pass
+    return metrics
+
+
+def rank(records, metric="solution_length", low=None, high=None):
+    """Records whose metrics[metric] lies in [low, high], hardest first
+
+    records are dicts with a "metrics" entry, like the JSON lines written
+    by maze_core.batch, so a level pack can be filtered without solving.
+    """
+    kept = [r for r in records
+            if (low is None or r["metrics"][metric] >= low)
+            and (high is None or r["metrics"][metric] <= high)]
+    return sorted(kept, key=lambda r: r["metrics"][metric], reverse=True)
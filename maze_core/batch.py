@@ -0,0 +1,141 @@
+"""Generate level packs of validated mazes across a process pool.
+
+    python -m maze_core.batch --kinds easy medium hard hicham mohamad \\
+        --count 1000 --out packs/
+
+Each kind is written to <out>/<kind>.jsonl, one maze per line, or with
+--format binary to <out>/<kind>/<seed>.maze (see maze_core.mazefile), as
+soon as a worker finishes it. Solutions are lists of (row, col) cells.
+JSON records of grid kinds also carry their difficulty metrics (see
+maze_core.analysis). Mazes that fail validation are counted and dropped.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from maze_core import hassan, hicham
+from maze_core.analysis import analyze
+from maze_core.distance import distance_field, path_to_goal
+from maze_core.mazefile import write_maze, write_wall_maze
+from maze_core.walls import ALL_WALLS, carve_wall_maze, new_wall_maze, solve_wall_maze
+
+DEFAULT_SIZES = {"easy": 11, "medium": 21, "hard": 31, "hicham": 23, "mohamad": 10}
+
+
+def _hassan(kind, size, seed):
+    generate = getattr(hassan, f"generate_{kind}_maze")
+    maze, start = generate(size, size, rng=random.Random(seed))
+    rows, cols = len(maze), len(maze[0])
+    exit_cell = (rows - 2, cols - 1)
+    if not hassan.is_path_available(maze, tuple(start), exit_cell):
+        return None
+    solution = path_to_goal(distance_field(maze, exit_cell), rows, cols, tuple(start))
+    return {"rows": rows, "cols": cols, "grid": maze, "solution": solution,
+            "metrics": analyze(maze, tuple(start), exit_cell)}
+
+
+def _hicham(size, seed):
+    start, goal = (0, size // 2), (size - 1, size // 2)
+    grid, solution = hicham.generate_level(size, size, random.Random(seed))
+    if not solution:
+        return None
+    return {"rows": size, "cols": size, "grid": grid,
+            "solution": [(y, x) for x, y in solution],
+            "metrics": analyze(grid, start[::-1], goal[::-1], wall=0)}
+
+
+def _mohamad(size, seed):
+    maze = new_wall_maze(size, size)
+    carve_wall_maze(maze, size, size, 0, 0, random.Random(seed))
+    # The game starts in the top-left cell and wins in the bottom-right one
+    solution = solve_wall_maze(maze, size, size, (0, 0), (size - 1, size - 1))
+    if solution is None:
+        return None
+    return {"rows": size, "cols": size, "cells": maze, "solution": solution}
+
+
+def generate_job(job):
+    """Worker entry point: build and validate one maze"""
+    kind, size, seed = job
+    if kind == "hicham":
+        maze = _hicham(size, seed)
+    elif kind == "mohamad":
+        maze = _mohamad(size, seed)
+    else:
+        maze = _hassan(kind, size, seed)
+    if maze is not None:
+        maze.update(kind=kind, seed=seed)
+    return kind, seed, maze
+
+
+def save(maze, out, fmt, jsonl):
+    kind, seed = maze["kind"], maze["seed"]
+    generator = kind if kind in ("hicham", "mohamad") else "hassan." + kind
+    if fmt == "binary":
+        path = os.path.join(out, kind, f"{seed}.maze")
+        if "cells" in maze:
+            write_wall_maze(path, maze["cells"], maze["rows"], maze["cols"], generator, seed,
+                            maze["solution"])
+        else:
+            write_maze(path, maze["grid"], generator, seed, maze["solution"])
+        return
+    record = dict(maze)
+    if "cells" in record:
+        # Only the wall bits; the visited bits are left over from carving
+        record["cells"] = bytes(cell & ALL_WALLS for cell in record["cells"]).hex()
+    else:
+        record["grid"] = ["".join(map(str, row)) for row in record["grid"]]
+    jsonl.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kinds", nargs="+", choices=sorted(DEFAULT_SIZES),
+                        default=sorted(DEFAULT_SIZES))
+    parser.add_argument("--count", type=int, default=100, help="mazes per kind")
+    parser.add_argument("--size", type=int, help="override every kind's default size")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first maze")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunksize", type=int, default=16)
+    parser.add_argument("--out", default="mazes")
+    parser.add_argument("--format", choices=["jsonl", "binary"], default="jsonl")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    jobs = [(kind, args.size or DEFAULT_SIZES[kind], args.seed + i)
+            for kind in args.kinds for i in range(args.count)]
+    files = {}
+    for kind in args.kinds:
+        if args.format == "binary":
+            os.makedirs(os.path.join(args.out, kind), exist_ok=True)
+        else:
+            files[kind] = open(os.path.join(args.out, f"{kind}.jsonl"), "w")
+    written = dict.fromkeys(args.kinds, 0)
+    rejected = dict.fromkeys(args.kinds, 0)
+    begin = time.perf_counter()
+    try:
+        with multiprocessing.Pool(args.workers) as pool:
+            for kind, seed, maze in pool.imap_unordered(generate_job, jobs, args.chunksize):
+                if maze is None:
+                    rejected[kind] += 1
+                    continue
+                save(maze, args.out, args.format, files.get(kind))
+                written[kind] += 1
+    finally:
+        for f in files.values():
+            f.close()
+
+    elapsed = time.perf_counter() - begin
+    for kind in args.kinds:
+        print(f"{kind:<8} {written[kind]:>7} written {rejected[kind]:>5} rejected",
+              file=sys.stderr)
+    print(f"{sum(written.values())} mazes in {elapsed:.2f}s with {args.workers} workers "
+          f"({sum(written.values()) / elapsed:.0f}/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
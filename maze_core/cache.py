@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+from collections import Counter
+
+from maze_core.mazefile import MazeFile, write_maze
+
+# Least recently used entries are deleted past this many bytes
+MAX_BYTES = 64 * 2 ** 20
+_SUFFIXES = (".maze", ".metrics.json", ".pickle")  # .pickle: older versions
+# prune() scans the whole cache, so it runs on a process's first store and
+# then once every this many stores into the same directory
+PRUNE_EVERY = 64
+_stores = Counter()
+
+
+def default_cache_dir():
+    return os.environ.get("MAZE_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "maze_game")
+
+
+def cache_key(generator, dims, seed, **params):
+    """Content address of one generated maze"""
+    spec = {"generator": generator, "dims": list(dims), "seed": seed,
+            "params": params}
+    blob = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _path(key, cache_dir):
+    return os.path.join(cache_dir or default_cache_dir(), key[:2], key + ".maze")
+
+
+def load(key, cache_dir=None):
+    """Return the cached (grid, solution) for key, or None on a miss"""
+    path = _path(key, cache_dir)
+    try:
+        with MazeFile(path) as f:
+            hit = f.grid(), f.solution() or []
+        os.utime(path)  # the modification time doubles as last use
+        return hit
+    except Exception:
+        return None  # unreadable entries of any kind are misses, not crashes
+
+
+def store(key, grid, solution, cache_dir=None):
+    """Save a grid and its solution, a list of (row, col) cells"""
+    path = _path(key, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    write_maze(tmp, grid, solution=solution)
+    os.replace(tmp, path)  # readers never see a half-written file
+    _stored(cache_dir)
+
+
+def _stored(cache_dir):
+    root = cache_dir or default_cache_dir()
+    if _stores[root] % PRUNE_EVERY == 0:
+        prune(root)
+    _stores[root] += 1
+
+
+def prune(cache_dir=None, max_bytes=MAX_BYTES):
+    """Delete the least recently used entries until the cache fits max_bytes"""
+    root = cache_dir or default_cache_dir()
+    entries = []
+    for sub in os.scandir(root):
+        if not (sub.is_dir() and len(sub.name) == 2):
+            continue
+        for entry in os.scandir(sub.path):
+            if entry.name.endswith(_SUFFIXES):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def _metrics_path(key, cache_dir):
+    return os.path.join(cache_dir or default_cache_dir(), key[:2], key + ".metrics.json")
+
+
+def load_metrics(key, cache_dir=None):
+    """Return the analysis stored beside the maze for key, or None"""
+    try:
+        with open(_metrics_path(key, cache_dir)) as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def store_metrics(key, metrics, cache_dir=None):
+    path = _metrics_path(key, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(metrics, f)
+    os.replace(tmp, path)
+    _stored(cache_dir)
+
+
+def cached(generator, dims, seed, build, cache_dir=None, **params):
+    """Return (grid, solution) for this maze, calling build() only on a miss
+
+    build must be deterministic for the given seed and parameters, since its
+    result is reused for every later request with the same key. Solutions
+    are lists of (row, col) cells.
+    """
+    key = cache_key(generator, dims, seed, **params)
+    hit = load(key, cache_dir)
+    if hit is not None:
+        return hit
+    grid, solution = build()
+    try:
+        store(key, grid, solution, cache_dir)
+    except OSError:
+        pass  # a read-only or full disk only costs us the cache
+    return grid, solution
@@ -0,0 +1,90 @@
+import random
+from collections import deque
+
+from maze_core.grid import row_views
+
+
+# Two-cell steps used by the 0/1 grid generators
+GRID_STEPS = [(-2, 0), (2, 0), (0, -2), (0, 2)]
+
+
+def _shuffled(directions, rng):
+    directions = list(directions)
+    rng.shuffle(directions)
+    return iter(directions)
+
+
+def carve_passages(start, directions, step, early_break=0.0, rng=random):
+    """Depth-first carve from start using an explicit stack.
+
+    step(cell, direction) carves one passage and returns the new cell, or
+    None when that direction is blocked. Directions are shuffled once per
+    cell, exactly like the old recursive carve functions did, and after a
+    child branch finishes its parent stops early with probability
+    early_break.
+    """
+    stack = [(start, _shuffled(directions, rng))]
+    while stack:
+        cell, moves = stack[-1]
+        for direction in moves:
+            nxt = step(cell, direction)
+            if nxt is not None:
+                stack.append((nxt, _shuffled(directions, rng)))
+                break
+        else:
+            stack.pop()
+            while stack and early_break and rng.random() < early_break:
+                stack.pop()
+
+
+def carve_grid(maze, start, early_break=0.0, rng=random):
+    """Carve a perfect maze into a grid of walls (1) from start (row, col)"""
+    rows, cols = len(maze), len(maze[0])
+    maze = row_views(maze)
+
+    def step(cell, direction):
+        r, c = cell
+        dr, dc = direction
+        nr, nc = r + dr, c + dc
+        if 0 < nr < rows and 0 < nc < cols and maze[nr][nc] == 1:
+            maze[nr][nc] = 0
+            maze[r + dr // 2][c + dc // 2] = 0
+            return nr, nc
+        return None
+
+    carve_passages(start, GRID_STEPS, step, early_break, rng)
+
+
+def bridge_grid(maze, cell):
+    """Join a walled-in grid cell to the nearest open one with two-cell steps
+
+    The shortest route through walled cells only is carved, so a perfect
+    maze stays perfect. Returns how many cells were opened (0 when cell is
+    already open), or None when there is no open cell to reach.
+    """
+    rows, cols = len(maze), len(maze[0])
+    maze = row_views(maze)
+    if maze[cell[0]][cell[1]] != 1:
+        return 0
+    parent = {cell: None}
+    queue = deque([cell])
+    while queue:
+        r, c = queue.popleft()
+        for dr, dc in GRID_STEPS:
+            nr, nc = r + dr, c + dc
+            if not (0 < nr < rows and 0 < nc < cols) or (nr, nc) in parent:
+                continue
+            parent[(nr, nc)] = (r, c)
+            if maze[nr][nc] == 1:
+                queue.append((nr, nc))
+                continue
+            # Open every cell back to the start and the walls between them
+            opened = 0
+            while parent[(nr, nc)] is not None:
+                pr, pc = parent[(nr, nc)]
+                maze[(pr + nr) // 2][(pc + nc) // 2] = 0
+                maze[pr][pc] = 0
+                nr, nc = pr, pc
+                opened += 2
+            return opened
+    return None
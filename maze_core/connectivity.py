@@ -0,0 +1,44 @@
+class DisjointSet:
+    """Union-find over flat cell indices (row * cols + col)"""
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # path halving
+            i = parent[i]
+        return i
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+
+def grid_sets(maze, wall=1):
+    """DisjointSet joining every pair of adjacent non-wall cells of maze"""
+    rows, cols = len(maze), len(maze[0])
+    sets = DisjointSet(rows * cols)
+    for r in range(rows):
+        row = maze[r]
+        below = maze[r + 1] if r + 1 < rows else None
+        for c in range(cols):
+            if row[c] == wall:
+                continue
+            i = r * cols + c
+            if c + 1 < cols and row[c + 1] != wall:
+                sets.union(i, i + 1)
+            if below is not None and below[c] != wall:
+                sets.union(i, i + cols)
+    return sets
@@ -0,0 +1,56 @@
+from array import array
+from collections import deque
+
+from maze_core.grid import is_array
+
+
+def distance_field(grid, goal, wall=1):
+    """Moves from every cell to goal (row, col), via one reverse BFS
+
+    The result is a flat array('i') indexed by row * cols + col; walls and
+    cells that cannot reach goal hold -1.
+    """
+    if is_array(grid):
+        rows, cols = grid.shape
+        open_cells = (grid != wall).tobytes()
+    else:
+        rows, cols = len(grid), len(grid[0])
+        open_cells = [cell != wall for row in grid for cell in row]
+    dist = array("i", [-1]) * (rows * cols)
+    start = goal[0] * cols + goal[1]
+    dist[start] = 0
+    queue = deque([start])
+    while queue:
+        i = queue.popleft()
+        d = dist[i] + 1
+        c = i % cols
+        for j in (i - cols, i + cols,
+                  i - 1 if c > 0 else -1, i + 1 if c + 1 < cols else -1):
+            if 0 <= j < rows * cols and open_cells[j] and dist[j] < 0:
+                dist[j] = d
+                queue.append(j)
+    return dist
+
+
+def next_step(dist, rows, cols, cell):
+    """Neighbour of cell (row, col) one move closer to the goal, or None"""
+    r, c = cell
+    d = dist[r * cols + c]
+    if d <= 0:
+        return None
+    for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+        if 0 <= nr < rows and 0 <= nc < cols and dist[nr * cols + nc] == d - 1:
+            return nr, nc
+    return None
+
+
+def path_to_goal(dist, rows, cols, cell):
+    """Shortest route from cell to the goal, both ends included"""
+    if dist[cell[0] * cols + cell[1]] < 0:
+        return []
+    path = [cell]
+    while True:
+        cell = next_step(dist, rows, cols, cell)
+        if cell is None:
+            return path
+        path.append(cell)
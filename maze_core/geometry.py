@@ -0,0 +1,76 @@
+from maze_core.grid import to_rows
+
+
+def _runs(flags):
+    """(start, end) pairs of the consecutive truthy entries in flags"""
+    runs = []
+    start = None
+    for i, flag in enumerate(flags):
+        if flag and start is None:
+            start = i
+        elif not flag and start is not None:
+            runs.append((start, i))
+            start = None
+    if start is not None:
+        runs.append((start, len(flags)))
+    return runs
+
+
+def merge_cells(grid, value):
+    """Cover the cells equal to value with (row, col, height, width) rectangles
+
+    Each row is split into maximal horizontal runs, and a run continues the
+    rectangle above it when both span exactly the same columns.
+    """
+    grid = to_rows(grid)
+    rects = []
+    open_rects = {}
+    for r, row in enumerate(grid):
+        spans = {}
+        for c0, c1 in _runs([cell == value for cell in row]):
+            rect = open_rects.pop((c0, c1), None)
+            if rect is None:
+                rect = [r, c0, 0, c1 - c0]
+            rect[2] += 1
+            spans[(c0, c1)] = rect
+        rects.extend(open_rects.values())
+        open_rects = spans
+    rects.extend(open_rects.values())
+    return [tuple(rect) for rect in rects]
+
+
+def _segments(h_edges, v_edges):
+    """Merge unit edges into maximal ((x0, y0), (x1, y1)) grid segments"""
+    segments = []
+    for y, flags in enumerate(h_edges):
+        segments += [((x0, y), (x1, y)) for x0, x1 in _runs(flags)]
+    for x, flags in enumerate(v_edges):
+        segments += [((x, y0), (x, y1)) for y0, y1 in _runs(flags)]
+    return segments
+
+
+def outline_segments(grid, value):
+    """Deduplicated, merged outline edges of every cell equal to value
+
+    Edges shared by two such cells are emitted once, so drawing the result
+    looks exactly like tracing each cell's square separately.
+    """
+    grid = to_rows(grid)
+    h, w = len(grid), len(grid[0])
+    hit = [[cell == value for cell in row] for row in grid]
+    h_edges = [[(y < h and hit[y][x]) or (y > 0 and hit[y - 1][x])
+                for x in range(w)] for y in range(h + 1)]
+    v_edges = [[(x < w and hit[y][x]) or (x > 0 and hit[y][x - 1])
+                for y in range(h)] for x in range(w + 1)]
+    return _segments(h_edges, v_edges)
+
+
+def wall_segments(maze, rows, cols):
+    """Merged wall segments of a packed wall maze, each shared wall once"""
+    h_edges = [[(y < rows and maze[y * cols + x] & 1)
+                or (y > 0 and maze[(y - 1) * cols + x] >> 2 & 1)
+                for x in range(cols)] for y in range(rows + 1)]
+    v_edges = [[(x < cols and maze[y * cols + x] >> 3 & 1)
+                or (x > 0 and maze[y * cols + x - 1] >> 1 & 1)
+                for y in range(rows)] for x in range(cols + 1)]
+    return _segments(h_edges, v_edges)
@@ -0,0 +1,75 @@
+import sys
+
+
+NEIGHBOURS_4 = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+NEIGHBOURS_8 = [(-1, -1), (-1, 0), (-1, 1), (0, -1),
+                (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def is_array(grid):
+    # An ndarray cannot exist before NumPy is imported, so never import it here
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(grid, np.ndarray)
+
+
+def _numpy():
+    try:
+        import numpy as np  # optional and slow to import, so only on demand
+    except ImportError:
+        raise ImportError("NumPy is required for array-backed maze grids") from None
+    return np
+
+
+def to_array(grid):
+    """Copy a list-of-lists grid into a uint8 ndarray"""
+    np = _numpy()
+    return np.array(grid, dtype=np.uint8)
+
+
+def new_grid(rows, cols, value, as_array=False):
+    """A rows x cols grid filled with value: lists, or a uint8 ndarray"""
+    if as_array:
+        np = _numpy()
+        return np.full((rows, cols), value, dtype=np.uint8)
+    return [[value] * cols for _ in range(rows)]
+
+
+def row_views(grid):
+    """Rows of grid to index cell by cell in Python
+
+    An array's rows come back as memoryviews of it, which read and write
+    its cells as fast as list items; list grids are returned as they are.
+    """
+    if is_array(grid):
+        return [memoryview(row) for row in grid]
+    return grid
+
+
+def to_rows(grid):
+    """Return grid as plain Python rows, converting arrays in one C call"""
+    if is_array(grid):
+        return grid.tolist()
+    return grid
+
+
+def count_neighbours(grid, value, diagonal=True):
+    """Count, for every cell, how many in-bounds neighbours equal value"""
+    deltas = NEIGHBOURS_8 if diagonal else NEIGHBOURS_4
+    if is_array(grid):
+        np = sys.modules["numpy"]
+        h, w = grid.shape
+        padded = np.zeros((h + 2, w + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = grid == value
+        counts = np.zeros((h, w), dtype=np.uint8)
+        for dr, dc in deltas:
+            counts += padded[1 + dr:1 + dr + h, 1 + dc:1 + dc + w]
+        return counts
+
+    h, w = len(grid), len(grid[0])
+    counts = [[0] * w for _ in range(h)]
+    for r in range(h):
+        for c in range(w):
+            counts[r][c] = sum(1 for dr, dc in deltas
+                               if 0 <= r + dr < h and 0 <= c + dc < w
+                               and grid[r + dr][c + dc] == value)
+    return counts
@@ -0,0 +1,166 @@
+"""Maze generators and solver of hassan's game, without any UI."""
+
+import random
+from collections import Counter, deque
+
+from maze_core.analysis import cached_analysis
+from maze_core.cache import cached
+from maze_core.carving import bridge_grid, carve_grid
+from maze_core.distance import distance_field, path_to_goal
+from maze_core.grid import new_grid, row_views
+from maze_core.instrument import timed
+from maze_core.solver import bfs
+
+# Bumped when a generator's maze for a given seed changes, so the disk
+# cache does not hand out mazes from the old version
+VERSIONS = {"Easy": 2, "Hard": 2}
+# Easy generation counters: "mazes" returned, "attempts" carved, "bridged"
+# mazes whose carve left the exit unreachable, "bridge_cells" opened and
+# "failed" bridges, each of which costs one more attempt
+easy_stats = Counter()
+
+
+@timed("hassan.generate_easy_maze")
+def generate_easy_maze(rows, cols, as_array=False, rng=random):
+
+    # Ensure odd dimensions for proper maze generation
+    if rows % 2 == 0: rows += 1
+    if cols % 2 == 0: cols += 1
+
+    while True:
+        maze = new_grid(rows, cols, 1, as_array)
+
+        # Start carving near the entrance to ensure connection; branches stop
+        # early sometimes to create simpler paths
+        start_row, start_col = 1, 1
+        maze[start_row][start_col] = 0
+        carve_grid(maze, (start_row, start_col), early_break=0.4, rng=rng)
+        easy_stats["attempts"] += 1
+
+        # The early stops can leave the exit walled in; the carved area is one
+        # tree holding the entrance, so the shortest bridge from the exit to it
+        # makes the maze solvable without regenerating
+        opened = bridge_grid(maze, (rows - 2, cols - 2))
+        if opened is None:
+            easy_stats["failed"] += 1
+            continue
+        easy_stats.update(mazes=1, bridged=opened > 0, bridge_cells=opened)
+        break
+
+    # Set entrance and exit
+    maze[1][0] = 0  # Entrance
+    maze[rows - 2][cols - 1] = 2  # Exit
+    return maze, [1, 0]
+
+
+@timed("hassan.generate_medium_maze")
+def generate_medium_maze(rows, cols, as_array=False, rng=random):
+    if rows % 2 == 0: rows += 1
+    if cols % 2 == 0: cols += 1
+    maze = new_grid(rows, cols, 1, as_array)
+
+    carve_grid(maze, (1, 1), rng=rng)
+    maze[1][0] = 0
+    maze[rows - 2][cols - 1] = 2  # Red exit square
+    return maze, [1, 0]
+
+
+@timed("hassan.generate_hard_maze")
+def generate_hard_maze(rows, cols, as_array=False, rng=random):
+
+    # Ensure odd dimensions
+    if rows % 2 == 0: rows += 1
+    if cols % 2 == 0: cols += 1
+
+    while True:
+        maze = new_grid(rows, cols, 1, as_array)
+        cells = row_views(maze)
+
+        # Start carving from multiple points to create complexity
+        start_points = [(1, 1), (1, cols - 2), (rows - 2, 1), (rows - 2, cols - 2)]
+        for r, c in start_points:
+            if cells[r][c] == 1:
+                cells[r][c] = 0
+                carve_grid(maze, (r, c), rng=rng)
+
+        # Add loops that never shorten the solution: a wall is only opened
+        # when every path cell next to it hangs off the same cell of the
+        # solution, so each loop stays within one side branch of it
+        branch = _solution_branches(maze, (1, 1), (rows - 2, cols - 2))
+        for _ in range((rows * cols) // 8):
+            r = rng.randrange(1, rows - 1)
+            c = rng.randrange(1, cols - 1)
+            if cells[r][c] == 1:
+                neighbors = [(r + dr, c + dc) for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+                             if cells[r + dr][c + dc] == 0]
+                roots = {branch[cell] for cell in neighbors}
+                if len(neighbors) >= 2 and len(roots) == 1:
+                    cells[r][c] = 0
+                    branch[r, c] = roots.pop()
+
+        # Set entrance and exit
+        maze[1][0] = 0  # Entrance
+        maze[rows - 2][cols - 1] = 2  # Exit
+
+        # Final check to ensure path exists; carve again if not
+        if is_path_available(maze, (1, 0), (rows - 2, cols - 1)):
+            break
+    return maze, [1, 0]
+
+
+def _solution_branches(maze, start, goal):
+    """Map every path cell to the cell of the start-goal route it hangs off"""
+    branch = {cell: cell for cell in bfs(maze, start, goal) or []}
+    queue = deque(branch)
+    rows, cols = len(maze), len(maze[0])
+    maze = row_views(maze)
+    while queue:
+        r, c = queue.popleft()
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if (0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] != 1
+                    and (nr, nc) not in branch):
+                branch[nr, nc] = branch[r, c]
+                queue.append((nr, nc))
+    return branch
+
+
+@timed("hassan.is_path_available")
+def is_path_available(maze, start, end):
+    """BFS to check if path exists from start to end"""
+    return bfs(maze, tuple(start), tuple(end)) is not None
+
+
+def build_maze(difficulty, rows, cols, seed, use_cache=True):
+    """Generate (maze, solution) for a seed, reusing the on-disk cache"""
+    generator = {"Easy": generate_easy_maze, "Medium": generate_medium_maze,
+                 "Hard": generate_hard_maze}[difficulty]
+
+    def build():
+        maze, start = generator(rows, cols, rng=random.Random(seed))
+        exit_cell = (len(maze) - 2, len(maze[0]) - 1)
+        dist = distance_field(maze, exit_cell)
+        return maze, path_to_goal(dist, len(maze), len(maze[0]), tuple(start))
+
+    if not use_cache:
+        return build()
+    return cached("hassan." + difficulty, (rows, cols), seed, build,
+                  **_cache_params(difficulty))
+
+
+def _cache_params(difficulty):
+    version = VERSIONS.get(difficulty)
+    return {"version": version} if version else {}
+
+
+def maze_metrics(difficulty, rows, cols, seed):
+    """Difficulty metrics of a seeded maze, cached beside the maze itself"""
+    maze, solution = build_maze(difficulty, rows, cols, seed)
+    exit_cell = (len(maze) - 2, len(maze[0]) - 1)
+    return cached_analysis("hassan." + difficulty, (rows, cols), seed, maze,
+                           solution[0], exit_cell, **_cache_params(difficulty))
+
+
+def fresh_maze(difficulty, rows, cols):
+    """(seed, maze, solution) for a newly drawn, uncached seed"""
+    seed = random.randrange(2 ** 32)
+    return (seed,) + tuple(build_maze(difficulty, rows, cols, seed, use_cache=False))
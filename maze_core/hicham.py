@@ -0,0 +1,173 @@
+"""Level generation, solving and scoring of hicham's game, without any UI."""
+
+import functools
+import random
+import sys
+from collections import deque
+
+from maze_core.analysis import cached_analysis
+from maze_core.cache import cached
+from maze_core.grid import count_neighbours, is_array, new_grid, row_views
+from maze_core.instrument import timed
+from maze_core.solver import bfs
+
+
+INITIAL_WIDTH = 21
+INITIAL_HEIGHT = 21
+SIZE_INCREMENT = 2
+STARTING_SCORE = 20
+IDEAL_BONUS = 20  # for finishing a level in exactly the ideal number of moves
+RECENT_LEVELS = 8  # levels kept in memory for replaying
+
+
+@timed("hicham.carve_main_path")
+def carve_main_path(width, height, as_array=False, rng=random):
+    grid = new_grid(height, width, 0, as_array)
+    cells = row_views(grid)
+    start = (0, height // 2)
+    goal  = (width - 1, height // 2)
+    visited = {start}
+    path = [start]
+    cells[start[1]][start[0]] = 1
+    while path:
+        x, y = path[-1]
+        if (x, y) == goal:
+            break
+        neighbors = []
+        for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
+            nx, ny = x+dx, y+dy
+            if 0<=nx<width and 0<=ny<height and (nx,ny) not in visited:
+                neighbors.append((nx,ny,dx//2,dy//2))
+        if not neighbors:
+            path.pop()
+        else:
+            nx,ny,wx,wy = rng.choice(neighbors)
+            cells[y+wy][x+wx] = 1
+            cells[ny][nx]     = 1
+            visited.add((nx,ny))
+            path.append((nx,ny))
+    return grid, path
+
+@timed("hicham.add_dead_end_branches")
+def add_dead_end_branches(grid, main_path, width, height, max_branches_per_cell=3, branch_len=(3,8), rng=random):
+    dirs = [(-2,0),(2,0),(0,-2),(0,2)]
+    grid = row_views(grid)
+    for cx,cy in main_path:
+        for _ in range(rng.randint(1, max_branches_per_cell)):
+            dx,dy = rng.choice(dirs)
+            x,y   = cx,cy
+            carve_list = []
+            for _ in range(rng.randint(*branch_len)):
+                nx,ny = x+dx, y+dy
+                wx,wy = x+dx//2, y+dy//2
+                if not (0<=nx<width and 0<=ny<height):
+                    break
+                if grid[wy][wx]==0 and grid[ny][nx]==0:
+                    carve_list += [(wy,wx),(ny,nx)]
+                    x,y = nx,ny
+                else:
+                    break
+            for ry,rx in carve_list:
+                grid[ry][rx] = 1
+
+@timed("hicham.find_path")
+def find_path(grid, start, goal):
+    # The solver works in (row, col); this game's cells are (x, y). Empty
+    # when the goal cannot be reached
+    path = bfs(grid, (start[1],start[0]), (goal[1],goal[0]), wall=0)
+    return [(x,y) for y,x in path or []]
+
+@timed("hicham.prune_wall_clusters")
+def prune_wall_clusters(grid, max_adjacent=4, rng=random):
+    # Works on a flat copy ringed with open cells, so the neighbours of
+    # cell i are i + offset with no bounds checks
+    H,W = len(grid), len(grid[0])
+    S = W+2
+    deltas = [(-1,-1),(-1,0),(-1,1),(0,-1),(0,1),(1,-1),(1,0),(1,1)]
+    offsets = [dy*S+dx for dy,dx in deltas]
+    if is_array(grid):
+        np = sys.modules["numpy"]
+        padded = np.pad(grid, 1, constant_values=1)
+        cells = memoryview(padded.reshape(-1))
+        crowded = (grid==0) & (count_neighbours(grid, 0) > max_adjacent)
+        ys,xs = crowded.nonzero()
+        work = deque(((ys+1)*S + xs+1).tolist())
+    else:
+        ring = b"\1"*S
+        cells = bytearray(ring + b"".join(b"\1"+bytes(row)+b"\1" for row in grid) + ring)
+        work = deque(i for i in range(S, len(cells)-S)
+                     if cells[i]==0 and sum(cells[i+o]==0 for o in offsets)>max_adjacent)
+    # Opening a wall only lowers its neighbours' counts, so only cells that
+    # start out crowded can break the limit; requeue each until it is fixed
+    while work:
+        i = work.popleft()
+        if cells[i]!=0: continue
+        nbrs = [i+o for o in offsets if cells[i+o]==0]
+        if len(nbrs)>max_adjacent:
+            cells[rng.choice(nbrs)] = 1
+            if len(nbrs)-1>max_adjacent:
+                work.append(i)
+    if is_array(grid):
+        grid[:] = padded[1:-1,1:-1]
+    else:
+        for y,row in enumerate(grid):
+            row[:] = cells[(y+1)*S+1:(y+1)*S+1+W]
+
+def is_in_bounds(x, y, width, height):
+    return 0<=x<width and 0<=y<height
+
+def can_move(x, y, grid, width, height):
+    return is_in_bounds(x,y,width,height) and grid[y][x]==1
+
+def level_size(level, initial=(INITIAL_WIDTH, INITIAL_HEIGHT), increment=SIZE_INCREMENT):
+    # Levels grow without bound; the game scrolls mazes bigger than its window
+    return (initial[0] + level*increment,
+            initial[1] + level*increment)
+
+def generate_level(width, height, rng=random, as_array=False):
+    """(grid, solution) of a new width x height level, without the cache"""
+    start = (0, height//2)
+    goal  = (width-1, height//2)
+    grid, main_path = carve_main_path(width, height, as_array, rng=rng)
+    add_dead_end_branches(grid, main_path, width, height, rng=rng)
+    prune_wall_clusters(grid, max_adjacent=4, rng=rng)
+    return grid, find_path(grid, start, goal)
+
+@timed("hicham.build_level")
+def build_level(level, seed, persist=False):
+    """(grid, solution) of a level, generated from seed
+
+    The last few levels are kept in memory, so replaying one (Reset) costs
+    nothing. With persist they also go to the disk cache, which is only
+    worth it for seeds that will be asked for again in a later session.
+    """
+    maze_width, maze_height = level_size(level)
+    if not persist:
+        return _recent_level(maze_width, maze_height, seed)
+
+    def build():
+        grid, solution = _recent_level(maze_width, maze_height, seed)
+        return grid, [(y,x) for x,y in solution]
+    grid, solution = cached("hicham", (maze_width, maze_height), seed, build, max_adjacent=4)
+    return grid, [(x,y) for y,x in solution]
+
+@functools.lru_cache(maxsize=RECENT_LEVELS)
+def _recent_level(width, height, seed):
+    return generate_level(width, height, random.Random(seed))
+
+def level_metrics(level, seed):
+    """Difficulty metrics of a level, cached beside the level itself"""
+    grid, _ = build_level(level, seed, persist=True)
+    maze_width, maze_height = level_size(level)
+    start = (maze_height//2, 0)
+    goal  = (maze_height//2, maze_width-1)
+    return cached_analysis("hicham", (maze_width, maze_height), seed, grid, start, goal,
+                           wall=0, max_adjacent=4)
+
+def settle_score(total_score, game_score):
+    """total_score after reaching the goal with game_score moves left over"""
+    if game_score==0:
+        return total_score + IDEAL_BONUS
+    if game_score<0:
+        return total_score + game_score  # one point lost per extra move
+    return total_score
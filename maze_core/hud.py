@@ -0,0 +1,53 @@
+from maze_core.instrument import count
+
+# Canvas anchors matching turtle.write's align argument
+ANCHORS = {"left": "sw", "center": "s", "right": "se"}
+
+
+class Hud:
+    """Named text fields kept as persistent canvas text items
+
+    Unlike clear() and write() on a turtle, set() edits the existing item,
+    and only when the text actually changes. Changes made in the same event
+    handler share one screen update, run on the next timer tick.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.canvas = screen.getcanvas()
+        self.fields = {}
+        self.dirty = False
+
+    def add(self, name, x, y, text="", align="left", font=("Arial", 8, "normal"),
+            color="black"):
+        """Place a field at turtle (x, y), aligned like turtle.write"""
+        item = self.canvas.create_text(x - 1, -y, text=text, anchor=ANCHORS[align],
+                                       fill=color, font=font)
+        self.fields[name] = [item, text]
+        self._changed()
+
+    def set(self, name, text):
+        field = self.fields[name]
+        if field[1] == text:
+            count("hud.unchanged")
+            return
+        self.canvas.itemconfigure(field[0], text=text)
+        field[1] = text
+        count("hud.changed")
+        self._changed()
+
+    def get(self, name):
+        return self.fields[name][1]
+
+    def canvas_items(self):
+        return [item for item, _ in self.fields.values()]
+
+    def _changed(self):
+        if not self.dirty:
+            self.dirty = True
+            self.screen.ontimer(self.flush, 0)
+
+    def flush(self):
+        if self.dirty:
+            self.dirty = False
+            self.screen.update()
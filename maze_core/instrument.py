@@ -0,0 +1,184 @@
+"""Opt-in timing spans, counters and latency samples for the games.
+
+Set MAZE_PROFILE to a file name before starting a game to record; the
+results are written when the process exits. A name ending in
+".trace.json" gets Chrome trace format (chrome://tracing, Perfetto), any
+other name a JSON summary. Code can also call enable() and save().
+
+While disabled, span() returns a shared no-op context manager, timed()
+functions pay one flag check and count()/input_event() return at once.
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+
+
+enabled = False
+spans = []  # (name, start, duration, thread id, args), times in seconds
+counters = Counter()
+samples = defaultdict(list)  # latency samples in milliseconds
+_pending_input = None
+_patched = False
+_t0 = time.perf_counter()
+_NULL = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name, self.args = name, args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        spans.append((self.name, self.start, time.perf_counter() - self.start,
+                      threading.get_ident(), self.args))
+
+
+def span(name, **args):
+    """Time a with-block under name"""
+    return _Span(name, args) if enabled else _NULL
+
+
+def timed(name):
+    """Decorator timing every call of a function under name"""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return fn(*args, **kwargs)
+            with _Span(name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return wrap
+
+
+def count(name, n=1):
+    if enabled:
+        counters[name] += n
+
+
+def input_event():
+    """Mark a key press; the next canvas redraw closes its latency sample"""
+    global _pending_input
+    if enabled and _pending_input is None:
+        _pending_input = time.perf_counter()
+
+
+def rendered():
+    global _pending_input
+    if _pending_input is not None:
+        samples["input_to_render"].append((time.perf_counter() - _pending_input) * 1000)
+        _pending_input = None
+
+
+def _counting(cls, method, name):
+    original = getattr(cls, method)
+
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        counters[name] += 1
+        return original(*args, **kwargs)
+    setattr(cls, method, wrapper)
+
+
+def _patch_turtle():
+    """Count turtle draw primitives, canvas items, redraws and timers"""
+    global _patched
+    if _patched:
+        return
+    _patched = True
+    try:
+        import turtle
+    except ImportError:  # no Tk here, so nothing to count
+        return
+
+    for method, name in [("_goto", "turtle.goto"), ("write", "turtle.write"),
+                         ("stamp", "turtle.stamp"), ("clear", "turtle.clear"),
+                         ("begin_fill", "turtle.fill"), ("dot", "turtle.dot")]:
+        _counting(turtle.RawTurtle, method, name)
+    for method in ("_createline", "_createpoly", "_createimage"):
+        _counting(turtle.TurtleScreenBase, method, "canvas.items")
+
+    flush = turtle.TurtleScreenBase._update
+
+    def update(self):
+        counters["canvas.update"] += 1
+        flush(self)
+        rendered()
+    turtle.TurtleScreenBase._update = update
+
+    ontimer = turtle.TurtleScreen.ontimer
+
+    def timer(self, fun, t=0):
+        counters["timer.scheduled"] += 1
+
+        def fire():
+            counters["timer.fired"] += 1
+            with span("timer." + getattr(fun, "__qualname__", "callback")):
+                fun()
+        return ontimer(self, fire, t)
+    turtle.TurtleScreen.ontimer = timer
+
+
+def enable(patch_turtle=True):
+    global enabled
+    enabled = True
+    if patch_turtle:
+        _patch_turtle()
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(int(q * len(values)), len(values) - 1)]
+
+
+def report():
+    """Per-name span totals, counters and latency percentiles"""
+    totals = {}
+    for name, _, duration, _, _ in spans:
+        entry = totals.setdefault(name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        entry["count"] += 1
+        entry["total_ms"] += duration * 1000
+        entry["max_ms"] = max(entry["max_ms"], duration * 1000)
+    latency = {name: {"count": len(values), "mean_ms": sum(values) / len(values),
+                      "p50_ms": _percentile(values, 0.5),
+                      "p95_ms": _percentile(values, 0.95), "max_ms": max(values)}
+               for name, values in samples.items() if values}
+    return {"spans": totals, "counters": dict(counters), "latency": latency}
+
+
+def chrome_trace():
+    """Spans as complete events and counters as one counter event"""
+    pid = os.getpid()
+    events = [{"name": name, "ph": "X", "ts": (start - _t0) * 1e6,
+               "dur": duration * 1e6, "pid": pid, "tid": tid, "args": args}
+              for name, start, duration, tid, args in spans]
+    now = (time.perf_counter() - _t0) * 1e6
+    if counters:
+        events.append({"name": "counters", "ph": "C", "ts": now, "pid": pid,
+                       "tid": 0, "args": dict(counters)})
+    for name, values in samples.items():
+        events.append({"name": name, "ph": "i", "s": "p", "ts": now, "pid": pid,
+                       "tid": 0, "args": report()["latency"].get(name, {})})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def save(path):
+    data = chrome_trace() if path.endswith(".trace.json") else report()
+    with open(path, "w") as f:
+        json.dump(data, f, indent=1, default=str)
+
+
+if os.environ.get("MAZE_PROFILE"):
+    enable()
+    atexit.register(save, os.environ["MAZE_PROFILE"])
@@ -0,0 +1,73 @@
+from maze_core.instrument import input_event
+
+
+class KeyRepeat:
+    """Turns held keys into repeated actions from a single timer
+
+    A key's action runs once when it is pressed, again after delay_ms if
+    it is still down, and then every interval_ms; with several keys down
+    the latest one wins. A fresh press restarts that schedule, and the
+    timer only runs while a key is held. Auto-repeat is ignored whether
+    the platform sends extra presses (Windows) or release/press pairs
+    (X11): a release only counts if no press follows within grace_ms, and
+    a key waiting out its grace never repeats, so a tap is one action.
+    """
+
+    def __init__(self, screen, interval_ms, grace_ms=30, delay_ms=250):
+        self.screen = screen
+        self.interval_ms = interval_ms
+        self.grace_ms = grace_ms
+        self.delay_ms = delay_ms
+        self.actions = {}
+        self.held = []
+        self.releasing = {}
+        self.chain = None  # token of the live timer; older ones do nothing
+
+    def bind(self, key, action):
+        self.actions[key] = action
+        self.screen.onkeypress(lambda: self._press(key), key)
+        self.screen.onkeyrelease(lambda: self._release(key), key)
+
+    def stop(self):
+        """Unbind every key and forget the held ones; the timer winds down"""
+        for key in self.actions:
+            self.screen.onkeypress(None, key)
+            self.screen.onkeyrelease(None, key)
+        self.actions.clear()
+        self.held.clear()
+        self.releasing.clear()
+
+    def _press(self, key):
+        if key in self.held:
+            self.releasing.pop(key, None)  # auto-repeat, still held
+            return
+        self.held.append(key)
+        input_event()
+        self._schedule(self.delay_ms)
+        self.actions[key]()
+
+    def _release(self, key):
+        if key in self.held:
+            token = self.releasing[key] = object()
+            self.screen.ontimer(lambda: self._drop(key, token), self.grace_ms)
+
+    def _drop(self, key, token):
+        if self.releasing.get(key) is token:
+            del self.releasing[key]
+            self.held.remove(key)
+
+    def _schedule(self, ms):
+        token = self.chain = object()
+        self.screen.ontimer(lambda: self._tick(token), ms)
+
+    def _tick(self, token):
+        if token is not self.chain:
+            return
+        if not self.held:
+            self.chain = None
+            return
+        down = [key for key in self.held if key not in self.releasing]
+        if down:
+            input_event()
+            self.actions[down[-1]]()
+        self._schedule(self.interval_ms)
@@ -0,0 +1,182 @@
+"""Compact binary maze files that open without reading the whole maze.
+
+Layout, all little-endian:
+
+    header   magic "MAZE", version, kind (0 = cell values, 1 = wall cells),
+             bits per cell, 16-byte generator id, rows, cols, signed seed,
+             solution length in moves, solution start row and col
+    rows     rows * ceil(cols * bits / 8) bytes, each row padded to a whole
+             byte, first cell in the high bits
+    solution one 2-bit direction code per move (Up, Right, Down, Left as in
+             maze_core.walls), packed the same way
+
+Cell-value grids (hassan/hicham) use the fewest of 1, 2, 4 or 8 bits that
+hold their largest value; wall cells use 4 bits for the wall flags.
+"""
+import mmap
+import struct
+
+from maze_core.grid import to_rows
+from maze_core.walls import ALL_WALLS, DIRS
+
+MAGIC = b"MAZE"
+VERSION = 2  # 2: signed seed
+GRID, WALLS = 0, 1
+HEADER = struct.Struct("<4sBBB16sIIqIII")
+NO_SEED = -2 ** 63  # random.Random takes negative seeds too
+NO_SOLUTION = 2 ** 32 - 1
+
+# byte -> the cell values it holds, for each supported cell width
+_UNPACK = {bits: [tuple(byte >> (8 - bits * (i + 1)) & (1 << bits) - 1
+                        for i in range(8 // bits)) for byte in range(256)]
+           for bits in (1, 2, 4, 8)}
+
+
+def _bits_for(value):
+    for bits in (1, 2, 4, 8):
+        if value < 1 << bits:
+            return bits
+    raise ValueError(f"cell value {value} does not fit in a byte")
+
+
+def _pack(values, bits):
+    per_byte = 8 // bits
+    out = bytearray((len(values) + per_byte - 1) // per_byte)
+    for i, value in enumerate(values):
+        out[i // per_byte] |= value << (8 - bits * (i % per_byte + 1))
+    return out
+
+
+def _directions(solution):
+    codes = []
+    for (r0, c0), (r1, c1) in zip(solution, solution[1:]):
+        codes.append(DIRS.index((c1 - c0, r1 - r0)))
+    return codes
+
+
+def write_rows(f, kind, rows, cols, bits, row_iter, generator="", seed=None,
+               solution=None):
+    """Write a maze whose rows come from an iterable, one row at a time"""
+    if seed is not None and not NO_SEED < seed < 2 ** 63:
+        raise ValueError(f"seed {seed} does not fit in a signed 64-bit field")
+    moves = len(solution) - 1 if solution else NO_SOLUTION
+    start = solution[0] if solution else (0, 0)
+    f.write(HEADER.pack(MAGIC, VERSION, kind, bits, generator.encode()[:16],
+                        rows, cols, NO_SEED if seed is None else seed,
+                        moves, start[0], start[1]))
+    for row in row_iter:
+        f.write(_pack(row, bits))
+    if solution:
+        f.write(_pack(_directions(solution), 2))
+
+
+def write_maze(path, grid, generator="", seed=None, solution=None):
+    """Save a cell-value grid; solution is a list of (row, col) cells"""
+    grid = to_rows(grid)
+    bits = _bits_for(max(max(row) for row in grid))
+    with open(path, "wb") as f:
+        write_rows(f, GRID, len(grid), len(grid[0]), bits, grid,
+                   generator, seed, solution)
+
+
+def write_wall_maze(path, maze, rows, cols, generator="", seed=None, solution=None):
+    """Save a packed wall maze (see maze_core.walls); visited bits are dropped"""
+    wall_rows = ([cell & ALL_WALLS for cell in maze[r * cols:(r + 1) * cols]]
+                 for r in range(rows))
+    with open(path, "wb") as f:
+        write_rows(f, WALLS, rows, cols, 4, wall_rows, generator, seed, solution)
+
+
+class MazeFile:
+    """Memory-mapped reader; rows and cells are decoded only when asked for"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            if not f.seek(0, 2):
+                raise ValueError(f"{path} is empty")  # mmap cannot map 0 bytes
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header(path)
+        except (ValueError, struct.error, UnicodeDecodeError) as exc:
+            self._map.close()
+            raise ValueError(f"{path} is not a valid maze file: {exc}") from None
+
+    def _read_header(self, path):
+        if len(self._map) < HEADER.size:
+            raise ValueError("shorter than the header")
+        (magic, version, self.kind, self.bits, generator, self.rows, self.cols,
+         seed, moves, start_row, start_col) = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a version {VERSION} maze file")
+        if self.bits not in _UNPACK:
+            raise ValueError(f"{self.bits} bits per cell")
+        self.generator = generator.rstrip(b"\0").decode()
+        self.seed = None if seed == NO_SEED else seed
+        self.solution_length = None if moves == NO_SOLUTION else moves
+        self._start = (start_row, start_col)
+        self._row_bytes = (self.cols * self.bits + 7) // 8
+        self._per_byte = 8 // self.bits
+        # A truncated file would otherwise read as short rows
+        size = HEADER.size + self.rows * self._row_bytes
+        if self.solution_length is not None:
+            size += (self.solution_length + 3) // 4
+        if len(self._map) < size:
+            raise ValueError(f"truncated, {len(self._map)} of {size} bytes")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.rows
+
+    def close(self):
+        self._map.close()
+
+    def row(self, r):
+        if not 0 <= r < self.rows:
+            raise IndexError(r)
+        begin = HEADER.size + r * self._row_bytes
+        table = _UNPACK[self.bits]
+        values = []
+        for byte in self._map[begin:begin + self._row_bytes]:
+            values.extend(table[byte])
+        return values[:self.cols]
+
+    def __getitem__(self, r):
+        return self.row(r)
+
+    def __iter__(self):
+        return (self.row(r) for r in range(self.rows))
+
+    def cell(self, r, c):
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError((r, c))
+        byte = self._map[HEADER.size + r * self._row_bytes + c // self._per_byte]
+        return _UNPACK[self.bits][byte][c % self._per_byte]
+
+    def grid(self):
+        """Materialise every row as a list-of-lists grid"""
+        return list(self)
+
+    def wall_maze(self):
+        """The maze as a packed bytearray for maze_core.walls"""
+        return bytearray(value for row in self for value in row)
+
+    def solution(self):
+        """Solution cells as (row, col), or None if none was stored"""
+        if self.solution_length is None:
+            return None
+        begin = HEADER.size + self.rows * self._row_bytes
+        codes = []
+        for byte in self._map[begin:begin + (self.solution_length + 3) // 4]:
+            codes.extend(_UNPACK[2][byte])
+        r, c = self._start
+        path = [(r, c)]
+        for code in codes[:self.solution_length]:
+            dc, dr = DIRS[code]
+            r, c = r + dr, c + dc
+            path.append((r, c))
+        return path
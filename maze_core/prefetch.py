@@ -0,0 +1,41 @@
+import threading
+
+
+class Prefetcher:
+    """Builds the next maze on a worker thread while the current one is played
+
+    Only one request is kept: prefetching a new key abandons the old one.
+    Worker threads are daemons, so a build in flight never delays exit.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._thread = None
+        self._box = None
+
+    def prefetch(self, key, build):
+        """Start build() in the background unless key is already on its way"""
+        if key == self._key:
+            return
+        box = {}
+
+        def run():
+            try:
+                box["result"] = build()
+            except Exception as exc:  # handed to whoever takes the result
+                box["error"] = exc
+
+        self._key, self._box = key, box
+        self._thread = threading.Thread(target=run, name=f"prefetch-{key}", daemon=True)
+        self._thread.start()
+
+    def take(self, key, build):
+        """Return the prefetched result for key, or call build() on a miss"""
+        if key != self._key:
+            return build()
+        self._thread.join()  # usually already finished
+        box = self._box
+        self._key = self._thread = self._box = None
+        if "error" in box:
+            raise box["error"]
+        return box["result"]
@@ -0,0 +1,75 @@
+from maze_core.geometry import outline_segments
+from maze_core.grid import to_rows
+
+
+# Above this many cells vector drawing is too slow to be usable
+RASTER_THRESHOLD = 200 * 200
+# Rows written per PhotoImage.put call, to bound the size of each Tk string
+ROWS_PER_PUT = 256
+
+
+def choose_backend(backend, rows, cols):
+    """Resolve "auto" to "raster" or "vector" for a rows x cols maze"""
+    if backend == "auto":
+        return "raster" if rows * cols > RASTER_THRESHOLD else "vector"
+    if backend not in ("raster", "vector"):
+        raise ValueError(f"unknown drawing backend {backend!r}")
+    return backend
+
+
+def draw_raster(screen, grid, colors, cell_size, x, y):
+    """Blit grid as one image with its top-left corner at turtle (x, y)
+
+    colors maps each cell value to a Tk colour. Rows are written in bulk at
+    one pixel per cell and the image is then scaled by cell_size. The image
+    is lowered below every other canvas item so the player, stamps and path
+    overlays stay on top. Returns the image; the caller must keep it
+    referenced or Tk will discard it.
+    """
+    import tkinter  # only needed once a window exists
+
+    grid = to_rows(grid)
+    rows, cols = len(grid), len(grid[0])
+    canvas = screen.getcanvas()
+    image = tkinter.PhotoImage(master=canvas, width=cols, height=rows)
+    for top in range(0, rows, ROWS_PER_PUT):
+        chunk = grid[top:top + ROWS_PER_PUT]
+        data = " ".join("{" + " ".join([colors[cell] for cell in row]) + "}"
+                        for row in chunk)
+        image.put(data, to=(0, top))
+
+    if cell_size >= 1:
+        image = image.zoom(int(cell_size))
+    else:
+        image = image.subsample(round(1 / cell_size))
+
+    # Turtle y grows upwards, canvas y downwards
+    item = canvas.create_image(x, -y, image=image, anchor="nw")
+    canvas.tag_lower(item)
+    return image
+
+
+def draw_raster_outlines(t, grid, value, cell_size, x, y, color="black", width=2):
+    """Blit the outlines of grid's cells equal to value as one image
+
+    The image looks like tracing outline_segments(grid, value) with a pen
+    of this width, on a transparent background, and its top-left corner is
+    at turtle (x, y). Its canvas item joins t's items, so t.clear() deletes
+    it like anything else t drew; the image is kept on t for Tk.
+    """
+    import tkinter  # only needed once a window exists
+
+    grid = to_rows(grid)
+    w, h = round(len(grid[0]) * cell_size), round(len(grid) * cell_size)
+    canvas = t.getscreen().getcanvas()
+    image = tkinter.PhotoImage(master=canvas, width=w, height=h)
+    half = width // 2
+    for (ax, ay), (bx, by) in outline_segments(grid, value):
+        # Each segment is a filled rectangle centred on its grid line
+        x0, y0 = round(ax * cell_size) - half, round(ay * cell_size) - half
+        x1, y1 = round(bx * cell_size) + width - half, round(by * cell_size) + width - half
+        image.put(color, to=(max(x0, 0), max(y0, 0), min(x1, w), min(y1, h)))
+    # Turtle y grows upwards, canvas y downwards
+    t.items.append(canvas.create_image(x, -y, image=image, anchor="nw"))
+    t.raster_image = image
+    return image
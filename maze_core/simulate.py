@@ -0,0 +1,215 @@
+"""Play hicham's game headlessly with bots, to tune its scoring.
+
+    python -m maze_core.simulate --bot optimal --noise 0.05 0.1 \\
+        --starting-score 10 20 30 --runs 10000
+
+A run starts at level 1 with the starting score and plays levels until
+the total score drops to zero or --max-levels is cleared, with the same
+rules as the game: a level is worth len(solution) - 1 moves, finishing
+in exactly that many adds IDEAL_BONUS and every extra move costs one
+point (see maze_core.hicham.settle_score). Level n of the run seeded s
+is the maze the game builds for run_seed s, so runs can be replayed.
+
+Every combination of the listed bots, noise levels, starting scores and
+size increments is simulated over the same seeds, and a table of where
+runs end is printed per combination.
+"""
+import argparse
+import functools
+import itertools
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from maze_core.distance import distance_field, next_step
+from maze_core.hicham import (INITIAL_HEIGHT, INITIAL_WIDTH, SIZE_INCREMENT,
+                              STARTING_SCORE, can_move, generate_level,
+                              level_size, settle_score)
+
+MOVES = ((1, 0), (0, 1), (-1, 0), (0, -1))  # east, south, west, north: clockwise
+
+
+def _open_moves(grid, width, height, x, y):
+    return [(dx, dy) for dx, dy in MOVES if can_move(x + dx, y + dy, grid, width, height)]
+
+
+# A bot is called once per level with (grid, width, height, goal, rng) and
+# returns a function from the player's cell (x, y) to an open move (dx, dy)
+
+def random_walk(grid, width, height, goal, rng):
+    """Any open neighbour, uniformly"""
+    return lambda x, y: rng.choice(_open_moves(grid, width, height, x, y))
+
+
+def wall_follower(grid, width, height, goal, rng):
+    """Keep the right hand on the wall"""
+    heading = 0
+
+    def choose(x, y):
+        nonlocal heading
+        for turn in (1, 0, -1, 2):  # right, ahead, left, back
+            dx, dy = MOVES[(heading + turn) % 4]
+            if can_move(x + dx, y + dy, grid, width, height):
+                heading = (heading + turn) % 4
+                return dx, dy
+    return choose
+
+
+def optimal(grid, width, height, goal, rng, noise=0.0):
+    """Shortest route to the goal, with a random move a noise fraction of the time"""
+    dist = distance_field(grid, (goal[1], goal[0]), wall=0)
+
+    def choose(x, y):
+        if noise and rng.random() < noise:
+            return rng.choice(_open_moves(grid, width, height, x, y))
+        r, c = next_step(dist, height, width, (y, x))
+        return c - x, r - y
+    return choose
+
+
+BOTS = {"random": random_walk, "wall": wall_follower, "optimal": optimal}
+
+
+def play_level(grid, solution, total_score, bot, rng):
+    """(moves, total_score after) of one level played by bot"""
+    height, width = len(grid), len(grid[0])
+    (x, y), goal = solution[0], solution[-1]
+    ideal_moves = len(solution) - 1
+    # Once this many moves are made the run is lost wherever the bot is,
+    # so the level can stop there instead of wandering on
+    budget = ideal_moves + total_score
+    choose = bot(grid, width, height, goal, rng)
+    moves = 0
+    while (x, y) != goal and moves < budget:
+        dx, dy = choose(x, y)
+        if not can_move(x + dx, y + dy, grid, width, height):
+            raise ValueError(f"bot moved into a wall at {(x, y)}")
+        x += dx; y += dy
+        moves += 1
+    return moves, settle_score(total_score, ideal_moves - moves)
+
+
+def play_run(seed, bot, starting_score=STARTING_SCORE, max_levels=30,
+             initial=(INITIAL_WIDTH, INITIAL_HEIGHT), increment=SIZE_INCREMENT,
+             mazes=None):
+    """[(ideal moves, moves, total_score after)] of each level a run reached
+
+    mazes, if given, is a dict keeping the generated levels, for other runs
+    with the same seed to play them again instead of regenerating them.
+    """
+    if mazes is None:
+        mazes = {}
+    rng = random.Random(f"bot-{seed}")
+    total_score = starting_score
+    levels = []
+    for level in range(1, max_levels + 1):
+        width, height = level_size(level, initial, increment)
+        key = (level, width, height)
+        if key not in mazes:
+            mazes[key] = generate_level(width, height, random.Random(seed + level))
+        grid, solution = mazes[key]
+        moves, total_score = play_level(grid, solution, total_score, bot, rng)
+        levels.append((len(solution) - 1, moves, total_score))
+        if total_score <= 0:
+            break
+    return levels
+
+
+def run_job(configs, seed):
+    """Worker entry point: play the run of every configuration on one seed"""
+    # Generation costs far more than playing, so every configuration
+    # plays the same generated levels
+    mazes = {}
+    results = []
+    for config in configs:
+        name, noise, starting_score, increment, max_levels = config
+        bot = BOTS[name]
+        if name == "optimal":
+            bot = functools.partial(bot, noise=noise)
+        results.append((config, play_run(seed, bot, starting_score, max_levels,
+                                         increment=increment, mazes=mazes)))
+    return results
+
+
+def new_stats():
+    return {"runs": 0, "levels": 0, "reached": {}, "lost": {}, "ideal": {},
+            "overshoot": {}, "cleared": []}
+
+
+def add_run(stats, levels):
+    """Fold the levels of one run into stats"""
+    stats["runs"] += 1
+    stats["levels"] += len(levels)
+    for level, (ideal_moves, moves, total_score) in enumerate(levels, 1):
+        lost = total_score <= 0
+        # A lost level stops at the move budget, so its overshoot means nothing
+        for key, value in (("reached", 1), ("lost", lost),
+                           ("ideal", moves == ideal_moves),
+                           ("overshoot", 0 if lost else moves - ideal_moves)):
+            stats[key][level] = stats[key].get(level, 0) + value
+    stats["cleared"].append(len(levels) - (levels[-1][2] <= 0))
+
+
+def report(config, stats, out=sys.stdout):
+    name, noise, starting_score, increment, max_levels = config
+    cleared = sorted(stats["cleared"])
+    runs = stats["runs"]
+    bot = f"{name} noise={noise}" if name == "optimal" else name
+    print(f"\n{bot}, starting score {starting_score}, size +{increment}/level: "
+          f"{runs} runs, levels cleared mean {sum(cleared) / runs:.2f} "
+          f"median {cleared[runs // 2]} p10 {cleared[runs // 10]} "
+          f"p90 {cleared[runs * 9 // 10]}", file=out)
+    print(f"{'level':>5} {'size':>9} {'reached':>8} {'lost':>6} {'ideal':>6} "
+          f"{'overshoot':>9}", file=out)
+    for level, reached in sorted(stats["reached"].items()):
+        width, height = level_size(level, increment=increment)
+        lost = stats["lost"][level]
+        overshoot = f"{stats['overshoot'][level] / (reached - lost):.1f}" if reached > lost else "-"
+        print(f"{level:>5} {f'{width}x{height}':>9} {reached / runs:>8.1%} "
+              f"{lost / reached:>6.1%} {stats['ideal'][level] / reached:>6.1%} "
+              f"{overshoot:>9}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bot", nargs="+", choices=sorted(BOTS), default=["optimal"])
+    parser.add_argument("--noise", nargs="+", type=float, default=[0.1],
+                        help="random move probability of the optimal bot")
+    parser.add_argument("--starting-score", nargs="+", type=int, default=[STARTING_SCORE])
+    parser.add_argument("--increment", nargs="+", type=int, default=[SIZE_INCREMENT],
+                        help="cells added to both sides of the maze per level")
+    parser.add_argument("--max-levels", type=int, default=30)
+    parser.add_argument("--runs", type=int, default=1000, help="runs per configuration")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunksize", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    configs = []
+    for name, noise, score, increment in itertools.product(
+            args.bot, args.noise, args.starting_score, args.increment):
+        config = (name, noise if name == "optimal" else 0.0, score, increment,
+                  args.max_levels)
+        if config not in configs:
+            configs.append(config)
+    seeds = range(args.seed, args.seed + args.runs)
+    stats = {config: new_stats() for config in configs}
+    begin = time.perf_counter()
+    with multiprocessing.Pool(args.workers) as pool:
+        play = functools.partial(run_job, configs)
+        for results in pool.imap_unordered(play, seeds, args.chunksize):
+            for config, levels in results:
+                add_run(stats[config], levels)
+
+    elapsed = time.perf_counter() - begin
+    for config in configs:
+        report(config, stats[config])
+    levels = sum(s["levels"] for s in stats.values())
+    print(f"\n{levels} levels in {elapsed:.2f}s with {args.workers} workers "
+          f"({levels / elapsed:.0f}/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
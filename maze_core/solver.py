@@ -0,0 +1,197 @@
+"""Shortest-path solvers on a flat, wall-padded copy of a grid.
+
+A grid of rows x cols becomes a bytearray of (rows + 2) x (cols + 2)
+cells, 1 for open and 0 for wall, with a ring of walls around it. The
+neighbours of flat index i are then always i - width, i + width, i - 1
+and i + 1, with no bounds checks. Parents live in one array('i').
+
+Every solver takes the grid, start and goal as (row, col) and returns
+the path from start to goal, both ends included, or None when the goal
+cannot be reached.
+"""
+
+import heapq
+import sys
+from array import array
+
+from maze_core.grid import is_array
+
+
+def flatten(grid, wall=1):
+    """(cells, width) of grid: padded bytearray of open flags, row stride"""
+    if is_array(grid):
+        # Straight from the array's memory, with no Python row lists
+        np = sys.modules["numpy"]
+        padded = np.pad(grid != wall, 1)
+        return bytearray(padded.astype(np.uint8).tobytes()), padded.shape[1]
+    cols = len(grid[0])
+    opened = bytes(0 if v == wall else 1 for v in range(256))
+    border = b"\0" * (cols + 2)
+    body = b"".join(b"\0" + bytes(row).translate(opened) + b"\0" for row in grid)
+    return bytearray(border + body + border), cols + 2
+
+
+def _index(cell, width):
+    return (cell[0] + 1) * width + cell[1] + 1
+
+
+def _cell(i, width):
+    r, c = divmod(i, width)
+    return r - 1, c - 1
+
+
+def _walk(parent, i, width):
+    """Cells from i back to the root of parent (whose parent is itself)"""
+    path = [_cell(i, width)]
+    while parent[i] != i:
+        i = parent[i]
+        path.append(_cell(i, width))
+    return path
+
+
+def _prepare(grid, start, goal, wall):
+    cells, width = flatten(grid, wall)
+    s, g = _index(start, width), _index(goal, width)
+    if not (cells[s] and cells[g]):
+        return None
+    return cells, width, s, g
+
+
+def bfs(grid, start, goal, wall=1):
+    """Breadth-first search, one frontier list per distance"""
+    prepared = _prepare(grid, start, goal, wall)
+    if prepared is None:
+        return None
+    return _bfs(*prepared)
+
+
+def _bfs(cells, width, s, g):
+    """bfs() on flat cells; clears the flags of the cells it visits"""
+    parent = array("i", [-1]) * len(cells)
+    parent[s] = s
+    cells[s] = 0  # a cleared flag doubles as "visited"
+    frontier = [s]
+    while frontier and parent[g] < 0:
+        nxt = []
+        append = nxt.append
+        for i in frontier:
+            j = i - width
+            if cells[j]:
+                cells[j] = 0; parent[j] = i; append(j)
+            j = i + width
+            if cells[j]:
+                cells[j] = 0; parent[j] = i; append(j)
+            j = i - 1
+            if cells[j]:
+                cells[j] = 0; parent[j] = i; append(j)
+            j = i + 1
+            if cells[j]:
+                cells[j] = 0; parent[j] = i; append(j)
+        frontier = nxt
+    if parent[g] < 0:
+        return None
+    return _walk(parent, g, width)[::-1]
+
+
+def bidirectional_bfs(grid, start, goal, wall=1):
+    """BFS from both ends at once, always growing the smaller frontier"""
+    prepared = _prepare(grid, start, goal, wall)
+    if prepared is None:
+        return None
+    cells, width, s, g = prepared
+    if s == g:
+        return [start]
+    # side[i]: 0 unseen or wall, 1 reached from start, 2 reached from goal
+    side = bytearray(len(cells))
+    parent = array("i", [-1]) * len(cells)
+    parent[s], parent[g] = s, g
+    side[s], side[g] = 1, 2
+    frontiers = {1: [s], 2: [g]}
+    offsets = (-width, width, -1, 1)
+    while frontiers[1] and frontiers[2]:
+        here = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2
+        nxt = []
+        for i in frontiers[here]:
+            for d in offsets:
+                j = i + d
+                if not cells[j]:
+                    continue
+                if side[j] == 0:
+                    side[j] = here
+                    parent[j] = i
+                    nxt.append(j)
+                elif side[j] != here:
+                    a, b = (i, j) if here == 1 else (j, i)
+                    return _walk(parent, a, width)[::-1] + _walk(parent, b, width)
+        frontiers[here] = nxt
+    return None
+
+
+def astar(grid, start, goal, wall=1):
+    """A* with the Manhattan distance, ties broken towards the goal"""
+    prepared = _prepare(grid, start, goal, wall)
+    if prepared is None:
+        return None
+    cells, width, s, g = prepared
+    gr, gc = divmod(g, width)
+    parent = array("i", [-1]) * len(cells)
+    cost = array("i", [-1]) * len(cells)
+    parent[s], cost[s] = s, 0
+    heap = [(0, 0, s)]
+    while heap:
+        _, neg, i = heapq.heappop(heap)
+        if i == g:
+            return _walk(parent, g, width)[::-1]
+        if -neg != cost[i]:
+            continue  # stale entry, a shorter route was found since
+        d = cost[i] + 1
+        for j in (i - width, i + width, i - 1, i + 1):
+            if cells[j] and (cost[j] < 0 or d < cost[j]):
+                cost[j] = d
+                parent[j] = i
+                r, c = divmod(j, width)
+                heapq.heappush(heap, (d + abs(r - gr) + abs(c - gc), -d, j))
+    return None
+
+
+def dead_end_fill(grid, start, goal, wall=1):
+    """Wall up dead ends until only routes between start and goal remain
+
+    In a perfect maze what is left is exactly the solution; loops survive
+    the filling, so a BFS over the remaining cells picks the shortest path.
+    """
+    prepared = _prepare(grid, start, goal, wall)
+    if prepared is None:
+        return None
+    cells, width, s, g = prepared
+    offsets = (-width, width, -1, 1)
+    degree = bytearray(len(cells))
+    stack = []
+    for i, flag in enumerate(cells):
+        if flag:
+            degree[i] = cells[i - width] + cells[i + width] + cells[i - 1] + cells[i + 1]
+            if degree[i] <= 1 and i != s and i != g:
+                stack.append(i)
+    while stack:
+        i = stack.pop()
+        if not cells[i]:
+            continue
+        cells[i] = 0
+        for d in offsets:
+            j = i + d
+            if cells[j]:
+                degree[j] -= 1
+                if degree[j] <= 1 and j != s and j != g:
+                    stack.append(j)
+    # Search what is left, which for perfect mazes is just the route
+    return _bfs(cells, width, s, g)
+
+
+SOLVERS = {"bfs": bfs, "bidirectional": bidirectional_bfs, "astar": astar,
+           "dead_end_fill": dead_end_fill}
+
+
+def solve_many(jobs, method="bfs", wall=1):
+    """Solve every (grid, start, goal) in jobs with one method, in order"""
+    solve = SOLVERS[method]
+    return [solve(grid, start, goal, wall) for grid, start, goal in jobs]
@@ -0,0 +1,111 @@
+import random
+
+from maze_core.mazefile import GRID, WALLS, write_rows
+from maze_core.walls import ALL_WALLS, VISITED
+
+
+def eller(rows, cols, rng=random, join_chance=0.5, down_chance=0.5):
+    """Yield (right, down) flags for each cell row of a perfect maze
+
+    Eller's algorithm: only the set ids of the current row are kept, so a
+    maze of any height is produced with O(cols) memory. right[c] opens the
+    wall between cells c and c + 1, down[c] the wall below cell c.
+    """
+    sets = [None] * cols
+    next_id = 0
+    for r in range(rows):
+        last = r == rows - 1
+        for c in range(cols):
+            if sets[c] is None:
+                sets[c] = next_id
+                next_id += 1
+        members = {}
+        for c, s in enumerate(sets):
+            members.setdefault(s, []).append(c)
+
+        # Join neighbours from different sets; the last row joins them all
+        right = [False] * cols
+        for c in range(cols - 1):
+            a, b = sets[c], sets[c + 1]
+            if a != b and (last or rng.random() < join_chance):
+                right[c] = True
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                moved = members.pop(b)
+                for m in moved:
+                    sets[m] = a
+                members[a].extend(moved)
+
+        # Every set continues downwards through at least one cell
+        down = [False] * cols
+        if not last:
+            for cells in members.values():
+                chosen = [c for c in cells if rng.random() < down_chance]
+                for c in chosen or [rng.choice(cells)]:
+                    down[c] = True
+            sets = [s if d else None for s, d in zip(sets, down)]
+        yield right, down
+
+
+def stream_grid(rows, cols, rng=random, wall=1, path=0, exit_value=2):
+    """Yield the rows of a rows x cols cell-value maze one at a time
+
+    Uses hassan's layout: odd dimensions, a wall border, the entrance at
+    (1, 0) and the exit at (rows - 2, cols - 1). Pass wall=0, path=1,
+    exit_value=1 for hicham's cell values.
+    """
+    if rows % 2 == 0: rows += 1
+    if cols % 2 == 0: cols += 1
+    cell_rows, cell_cols = (rows - 1) // 2, (cols - 1) // 2
+
+    yield [wall] * cols
+    for r, (right, down) in enumerate(eller(cell_rows, cell_cols, rng)):
+        row = [wall] * cols
+        for c in range(cell_cols):
+            row[2 * c + 1] = path
+            if right[c]:
+                row[2 * c + 2] = path
+        if r == 0:
+            row[0] = path  # Entrance
+        if r == cell_rows - 1:
+            row[cols - 1] = exit_value
+        yield row
+        if r < cell_rows - 1:
+            below = [wall] * cols
+            for c in range(cell_cols):
+                if down[c]:
+                    below[2 * c + 1] = path
+            yield below
+    yield [wall] * cols
+
+
+def stream_wall_rows(rows, cols, rng=random):
+    """Yield each row of a packed wall maze (maze_core.walls) as a bytearray"""
+    up = [False] * cols
+    for right, down in eller(rows, cols, rng):
+        row = bytearray(cols)
+        for c in range(cols):
+            cell = VISITED
+            if not up[c]: cell |= 1
+            if not right[c]: cell |= 2
+            if not down[c]: cell |= 4
+            if c == 0 or not right[c - 1]: cell |= 8
+            row[c] = cell
+        up = down
+        yield row
+
+
+def write_streamed(path, rows, cols, seed=None, walls=False):
+    """Generate a maze straight into a maze file, never holding it in memory"""
+    rng = random.Random(seed)
+    with open(path, "wb") as f:
+        if walls:
+            write_rows(f, WALLS, rows, cols, 4,
+                       ([cell & ALL_WALLS for cell in row]
+                        for row in stream_wall_rows(rows, cols, rng)),
+                       "eller.walls", seed)
+        else:
+            if rows % 2 == 0: rows += 1
+            if cols % 2 == 0: cols += 1
+            write_rows(f, GRID, rows, cols, 2, stream_grid(rows, cols, rng),
+                       "eller", seed)
@@ -0,0 +1,78 @@
+import math
+import time
+from collections import deque
+
+from maze_core.instrument import span
+
+
+class Tweener:
+    """Glides turtles towards their targets from one ontimer loop
+
+    Every turtle has a queue of moves, so a new move chains after the ones
+    already running. Each frame spends a time budget of speed * elapsed
+    pixels along the queue, so the pace stays the same when frames arrive
+    late, and the screen is updated once. The loop only runs while some
+    move is queued and never sleeps, so key presses and clicks are handled
+    between frames.
+    """
+
+    def __init__(self, screen, speed, frame_ms=10):
+        self.screen = screen
+        self.speed = speed
+        self.frame_ms = frame_ms
+        self.queues = {}
+        self.running = False
+        self.last = 0.0
+
+    def move(self, t, target, done=None):
+        """Queue a glide of t to target, an (x, y) or a function returning one
+
+        A function is asked again every frame, so the target may move (for
+        example when a viewport scrolls). done() runs on arrival.
+        """
+        self.queues.setdefault(t, deque()).append((target, done))
+        if not self.running:
+            self.running = True
+            self.last = time.perf_counter()
+            self.screen.ontimer(self._frame, self.frame_ms)
+
+    def pending(self, t):
+        """Moves of t not finished yet, the running one included"""
+        return len(self.queues.get(t, ()))
+
+    def cancel(self, t=None):
+        """Drop the queued moves of t, or of every turtle; they stop in place"""
+        queues = self.queues.values() if t is None else [self.queues.get(t, ())]
+        for queue in queues:
+            queue and queue.clear()
+
+    def _frame(self):
+        with span("tween.frame", turtles=len(self.queues)):
+            self._advance()
+        if self.queues:
+            self.screen.ontimer(self._frame, self.frame_ms)
+        else:
+            self.running = False
+
+    def _advance(self):
+        now = time.perf_counter()
+        # A long stall (window drag, breakpoint) must not teleport turtles
+        budget = self.speed * min(now - self.last, 0.1)
+        self.last = now
+        for t, queue in list(self.queues.items()):
+            step = budget
+            while queue and step > 0:
+                target, done = queue[0]
+                x, y = target() if callable(target) else target
+                dx, dy = x - t.xcor(), y - t.ycor()
+                dist = math.hypot(dx, dy)
+                if dist > step:
+                    t.goto(t.xcor() + dx * step / dist, t.ycor() + dy * step / dist)
+                    break
+                t.goto(x, y)
+                step -= dist
+                queue.popleft()
+                if done:
+                    done()
+        self.queues = {t: queue for t, queue in self.queues.items() if queue}
+        self.screen.update()
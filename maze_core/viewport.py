@@ -0,0 +1,232 @@
+from maze_core.instrument import span
+
+
+def _new_turtle():
+    import turtle  # only needed once a window exists
+    t = turtle.Turtle(visible=False)
+    t.speed(0)
+    t.penup()
+    return t
+
+
+def _items(t):
+    """Canvas items a turtle has drawn: lines, fills, text and stamps"""
+    items = list(t.items)
+    for stamp in t.stampItems:
+        items.extend(stamp if isinstance(stamp, tuple) else (stamp,))
+    return items
+
+
+class Viewport:
+    """Camera over a grid larger than the window, drawing only what is in view
+
+    The view is width x height pixels with its top-left corner at turtle
+    (x0, y0). The grid is cut into tile x tile blocks and
+    draw_tile(t, r0, c0, r1, c1, to_screen) draws rows r0..r1-1, cols
+    c0..c1-1 with the turtle t, placing the top-left corner of cell (r, c)
+    at to_screen(r, c), this viewport's own. Only blocks touching the
+    view exist on the canvas, so drawing cost depends on the window size,
+    not the maze size.
+
+    follow() recentres the camera when the player comes within margin cells
+    of an edge: blocks that stay in view and every anchor()ed turtle are
+    moved on the canvas, blocks that left the view are cleared and only the
+    newly exposed strip is drawn. Zooming scales the anchored drawings and
+    redraws the visible blocks at the new cell size.
+
+    Blocks at the edge stick out of the view; with mask set to a colour
+    they are hidden under a frame of that colour, and overlay()ed turtles
+    (HUD text, buttons) are kept above the frame.
+    """
+
+    def __init__(self, screen, rows, cols, width, height, x0, y0, cell_size,
+                 draw_tile, tile=16, margin=3, zoom_levels=(1,), mask=None):
+        self.screen = screen
+        self.canvas = screen.getcanvas()
+        self.rows, self.cols = rows, cols
+        self.width, self.height = width, height
+        self.x0, self.y0 = x0, y0
+        self.base_size = cell_size
+        self.draw_tile = draw_tile
+        self.tile = tile
+        self.margin = margin
+        self.zoom_levels = list(zoom_levels)
+        self.zoom = self.zoom_levels.index(1) if 1 in self.zoom_levels else 0
+        self.top = self.left = 0
+        self.focus = (0, 0)
+        self.tiles = {}
+        self.pool = []
+        self.anchored = []
+        self.overlays = []
+        self._sync()
+        self.frame = self._draw_frame(mask) if mask else None
+        self._raise()
+
+    # === COORDINATES ===
+
+    @property
+    def size(self):
+        return self.base_size * self.zoom_levels[self.zoom]
+
+    @property
+    def view_rows(self):
+        return max(1, int(self.height // self.size))
+
+    @property
+    def view_cols(self):
+        return max(1, int(self.width // self.size))
+
+    def origin(self):
+        """Turtle coordinates of the top-left corner of cell (0, 0)"""
+        return (self.x0 - self.left * self.size, self.y0 + self.top * self.size)
+
+    def to_screen(self, r, c):
+        """Top-left corner of cell (r, c) in turtle coordinates"""
+        ox, oy = self.origin()
+        return ox + c * self.size, oy - r * self.size
+
+    def center(self, r, c):
+        x, y = self.to_screen(r, c)
+        return x + self.size / 2, y - self.size / 2
+
+    def in_view(self, r, c):
+        return (self.top <= r < self.top + self.view_rows
+                and self.left <= c < self.left + self.view_cols)
+
+    # === CAMERA ===
+
+    def _clamp(self, top, left):
+        top = min(max(top, 0), max(self.rows - self.view_rows, 0))
+        left = min(max(left, 0), max(self.cols - self.view_cols, 0))
+        return top, left
+
+    def follow(self, r, c):
+        """Keep cell (r, c) away from the view edges; True if the view moved"""
+        self.focus = (r, c)
+        margin = min(self.margin, self.view_rows // 2, self.view_cols // 2)
+        top, left = self.top, self.left
+        if not (top + margin <= r < top + self.view_rows - margin):
+            top = r - self.view_rows // 2
+        if not (left + margin <= c < left + self.view_cols - margin):
+            left = c - self.view_cols // 2
+        top, left = self._clamp(top, left)
+        if (top, left) == (self.top, self.left):
+            return False
+        self._move_camera(top, left, self.zoom)
+        return True
+
+    def set_zoom(self, zoom):
+        """Switch to zoom_levels[zoom], keeping the focus cell in view"""
+        zoom = min(max(zoom, 0), len(self.zoom_levels) - 1)
+        if zoom == self.zoom:
+            return
+        r, c = self.focus
+        old = self.zoom
+        self.zoom = zoom
+        top, left = self._clamp(r - self.view_rows // 2, c - self.view_cols // 2)
+        self.zoom = old
+        # Every visible block changes size, so they are all redrawn
+        for key in list(self.tiles):
+            self._release(key)
+        self._move_camera(top, left, zoom)
+
+    def zoom_in(self):
+        self.set_zoom(self.zoom + 1)
+
+    def zoom_out(self):
+        self.set_zoom(self.zoom - 1)
+
+    def anchor(self, t):
+        """Keep a turtle and its drawings fixed to the maze, not the window"""
+        self.anchored.append(t)
+
+    def overlay(self, t):
+        """Keep a turtle's drawings, or a Hud's text, above the mask frame"""
+        self.overlays.append(t)
+        self._raise()
+
+    def _move_camera(self, top, left, zoom):
+        with span("viewport.scroll", top=top, left=left, zoom=zoom):
+            self._shift(top, left, zoom)
+
+    def _shift(self, top, left, zoom):
+        tracer = self.screen.tracer()
+        self.screen.tracer(0)
+        (ox, oy), size = self.origin(), self.size
+        self.top, self.left, self.zoom = top, left, zoom
+        (nx, ny), factor = self.origin(), self.size / size
+
+        def place(x, y):
+            return nx + (x - ox) * factor, ny + (y - oy) * factor
+
+        # Canvas y grows downwards, turtle y upwards
+        for t in self.anchored:
+            down = t.isdown()
+            t.penup()  # finishes the current line so it is a plain item
+            for item in _items(t):
+                if factor != 1:
+                    self.canvas.scale(item, ox, -oy, factor, factor)
+                self.canvas.move(item, nx - ox, oy - ny)
+            t.goto(*place(*t.pos()))
+            if down:
+                t.pendown()
+        for t in self.tiles.values():
+            for item in _items(t):
+                self.canvas.move(item, nx - ox, oy - ny)
+        self._sync()
+        self._raise()
+        self.screen.tracer(tracer)
+        self.screen.update()
+
+    # === TILES ===
+
+    def _visible_tiles(self):
+        tile = self.tile
+        r0, c0 = self.top // tile, self.left // tile
+        r1 = min(self.top + self.view_rows, self.rows - 1) // tile
+        c1 = min(self.left + self.view_cols, self.cols - 1) // tile
+        return {(tr, tc) for tr in range(r0, r1 + 1) for tc in range(c0, c1 + 1)}
+
+    def _release(self, key):
+        t = self.tiles.pop(key)
+        t.clear()
+        self.pool.append(t)
+
+    def _sync(self):
+        visible = self._visible_tiles()
+        for key in set(self.tiles) - visible:
+            self._release(key)
+        for tr, tc in visible - set(self.tiles):
+            t = self.pool.pop() if self.pool else _new_turtle()
+            r0, c0 = tr * self.tile, tc * self.tile
+            with span("viewport.tile", row=r0, col=c0):
+                self.draw_tile(t, r0, c0, min(r0 + self.tile, self.rows),
+                               min(c0 + self.tile, self.cols), self.to_screen)
+            # The maze stays below the player, path and stamps drawn earlier
+            for item in _items(t):
+                self.canvas.tag_lower(item)
+            self.tiles[(tr, tc)] = t
+
+    # === MASK ===
+
+    def _draw_frame(self, color):
+        t = _new_turtle()
+        t.color(color)
+        band = self.tile * self.size * max(self.zoom_levels)
+        x0, y0, x1, y1 = self.x0, self.y0, self.x0 + self.width, self.y0 - self.height
+        for left, top, right, bottom in [(x0 - band, y0 + band, x1 + band, y0),
+                                         (x0 - band, y1, x1 + band, y1 - band),
+                                         (x0 - band, y0, x0, y1),
+                                         (x1, y0, x1 + band, y1)]:
+            t.goto(left, top)
+            t.begin_fill()
+            for x, y in [(right, top), (right, bottom), (left, bottom)]:
+                t.goto(x, y)
+            t.end_fill()
+        return t
+
+    def _raise(self):
+        for t in ([self.frame] if self.frame else []) + self.overlays:
+            items = t.canvas_items() if hasattr(t, "canvas_items") else _items(t)
+            for item in items:
+                self.canvas.tag_raise(item)
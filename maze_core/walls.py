@@ -0,0 +1,59 @@
+import random
+from collections import deque
+
+from maze_core.carving import carve_passages
+
+
+# Directions: Up=0, Right=1, Down=2, Left=3, stored as bits 0-3 of a cell
+DIRS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+ALL_WALLS = 0b01111
+VISITED = 0b10000
+
+
+def new_wall_maze(rows, cols):
+    """One byte per cell, row-major, with every wall up and nothing visited"""
+    return bytearray([ALL_WALLS]) * (rows * cols)
+
+
+def has_wall(cell, direction):
+    return cell >> direction & 1
+
+
+def solve_wall_maze(maze, rows, cols, start, goal):
+    """Shortest route of (row, col) cells from start to goal, or None, by BFS"""
+    parent = {start: None}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        if cell == goal:
+            path = []
+            while cell is not None:
+                path.append(cell)
+                cell = parent[cell]
+            return path[::-1]
+        r, c = cell
+        for i, (dx, dy) in enumerate(DIRS):
+            nr, nc = r + dy, c + dx
+            if (0 <= nr < rows and 0 <= nc < cols and not has_wall(maze[r * cols + c], i)
+                    and (nr, nc) not in parent):
+                parent[nr, nc] = cell
+                queue.append((nr, nc))
+    return None
+
+
+def carve_wall_maze(maze, rows, cols, x, y, rng=random):
+    """Carve a perfect maze into a packed wall maze starting at (x, y)"""
+    maze[y * cols + x] |= VISITED
+
+    def step(cell, direction):
+        cx, cy = cell
+        i, (dx, dy) = direction
+        nx, ny = cx + dx, cy + dy
+        if 0 <= nx < cols and 0 <= ny < rows and not maze[ny * cols + nx] & VISITED:
+            maze[cy * cols + cx] &= ~(1 << i)
+            maze[ny * cols + nx] &= ~(1 << (i + 2) % 4)
+            maze[ny * cols + nx] |= VISITED
+            return nx, ny
+        return None
+
+    carve_passages((x, y), list(enumerate(DIRS)), step, rng=rng)
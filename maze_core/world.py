@@ -0,0 +1,69 @@
+import random
+from collections import OrderedDict
+
+from maze_core.carving import carve_grid
+
+
+class ChunkedWorld:
+    """Endless maze made of chunks that are generated on demand
+
+    Each chunk is a (2 * chunk_cells)-square block of a 0/1 grid (1 = wall)
+    whose first row and column are its top and left walls. Its interior is
+    a perfect maze carved from (seed, cx, cy) alone, and every chunk border
+    gets one opening chosen from the seeds of the two chunks it separates,
+    so any chunk can be rebuilt identically after eviction and the whole
+    world stays connected. At most max_chunks chunks are kept, least
+    recently used first out.
+    """
+
+    def __init__(self, seed, chunk_cells=16, max_chunks=64):
+        self.seed = seed
+        self.chunk_cells = chunk_cells
+        self.size = 2 * chunk_cells
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()
+        self.generated = 0
+
+    def _rng(self, *key):
+        return random.Random(":".join(map(str, (self.seed,) + key)))
+
+    def _build(self, cx, cy):
+        size = self.size
+        grid = [[1] * size for _ in range(size)]
+        grid[1][1] = 0
+        carve_grid(grid, (1, 1), rng=self._rng("chunk", cx, cy))
+        # Openings shared with the chunks to the left and above
+        grid[2 * self._rng("left", cx, cy).randrange(self.chunk_cells) + 1][0] = 0
+        grid[0][2 * self._rng("top", cx, cy).randrange(self.chunk_cells) + 1] = 0
+        self.generated += 1
+        return grid
+
+    def chunk(self, cx, cy):
+        """Grid of chunk (cx, cy), building it if it is not cached"""
+        key = (cx, cy)
+        grid = self.chunks.get(key)
+        if grid is not None:
+            self.chunks.move_to_end(key)
+            return grid
+        grid = self.chunks[key] = self._build(cx, cy)
+        if len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return grid
+
+    def chunk_of(self, r, c):
+        return c // self.size, r // self.size
+
+    def cell(self, r, c):
+        """Cell value at world (row, col); any integers are valid"""
+        grid = self.chunk(c // self.size, r // self.size)
+        return grid[r % self.size][c % self.size]
+
+    def is_open(self, r, c):
+        return self.cell(r, c) != 1
+
+    def preload(self, r, c, radius=1):
+        """Build every chunk within radius chunks of world (row, col)"""
+        cx, cy = self.chunk_of(r, c)
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                self.chunk(cx + dx, cy + dy)
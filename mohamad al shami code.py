@@ -2,6 +2,8 @@ import turtle
 import random
 import time
 
+from maze_core import Hud, KeyRepeat, carve_wall_maze, has_wall, new_wall_maze, timed, wall_segments
+
 # Maze settings
 CELL_SIZE = 40
 ROWS, COLS = 10, 10
@@ -9,82 +11,67 @@ ROWS, COLS = 10, 10
 # Directions: Up=0, Right=1, Down=2, Left=3
 DIRS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
 
-# Maze data
-maze = [[[1, 1, 1, 1] for _ in range(COLS)] for _ in range(ROWS)]
-visited = [[False for _ in range(COLS)] for _ in range(ROWS)]
+# Maze data: one byte per cell, 4 wall bits plus a visited bit
+maze = new_wall_maze(ROWS, COLS)
 
 # Global state
 player_x, player_y = 0, 0
 start_time = time.time()
 game_running = True
-held_direction = None  # "up", "down", "left", "right", or None
-
-# Setup screen
-screen = turtle.Screen()
-screen.setup(width=800, height=800)
-screen.title("Maze Game - Find the Exit!")
-screen.bgcolor("white")
-screen.tracer(0)
-
-# Drawer turtle
-drawer = turtle.Turtle()
-drawer.hideturtle()
-drawer.speed(0)
-drawer.pensize(3)
-drawer.penup()
-
-# Player turtle
-player = turtle.Turtle()
-player.shape("turtle")
-player.color("blue")
-player.penup()
-player.speed(3)
-player.shapesize(stretch_wid=1, stretch_len=1)
-player.showturtle()
-
-# UI turtles
-message_writer = turtle.Turtle()
-message_writer.hideturtle()
-message_writer.penup()
-
-timer_writer = turtle.Turtle()
-timer_writer.hideturtle()
-timer_writer.penup()
-timer_writer.goto(-40, 250)
-timer_writer.color("black")
-
-def carve_maze(x, y):
-    visited[y][x] = True
-    directions = list(enumerate(DIRS))
-    random.shuffle(directions)
-
-    for i, (dx, dy) in directions:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < COLS and 0 <= ny < ROWS and not visited[ny][nx]:
-            maze[y][x][i] = 0
-            maze[ny][nx][(i + 2) % 4] = 0
-            carve_maze(nx, ny)
-
-def draw_cell(x, y, walls):
-    start_x = -COLS * CELL_SIZE // 2 + x * CELL_SIZE
-    start_y = ROWS * CELL_SIZE // 2 - y * CELL_SIZE
+
+# Screen and turtles, created by setup_ui() when the game starts
+screen = drawer = player = message_writer = hud = None
+
+def setup_ui():
+    global screen, drawer, player, message_writer, hud
+    screen = turtle.Screen()
+    screen.setup(width=800, height=800)
+    screen.title("Maze Game - Find the Exit!")
+    screen.bgcolor("white")
+    screen.tracer(0)
+
+    # Drawer turtle
+    drawer = turtle.Turtle()
+    drawer.hideturtle()
+    drawer.speed(0)
+    drawer.pensize(3)
     drawer.penup()
-    drawer.goto(start_x, start_y)
-    drawer.setheading(0)
 
-    for i in range(4):
-        if walls[i]:
-            drawer.pendown()
-        else:
-            drawer.penup()
-        drawer.forward(CELL_SIZE)
-        drawer.right(90)
+    # Player turtle
+    player = turtle.Turtle()
+    player.shape("turtle")
+    player.color("blue")
+    player.penup()
+    player.speed(3)
+    player.shapesize(stretch_wid=1, stretch_len=1)
+    player.showturtle()
+
+    # UI turtles
+    message_writer = turtle.Turtle()
+    message_writer.hideturtle()
+    message_writer.penup()
+
+    # Timer text, edited in place rather than cleared and rewritten
+    hud = Hud(screen)
+    hud.add("timer", -40, 250, font=("Arial", 16, "bold"))
+
+@timed("mohamad.carve_maze")
+def carve_maze(x, y, rng=random):
+    carve_wall_maze(maze, ROWS, COLS, x, y, rng)
+
+def draw_wall(segment):
+    (x0, y0), (x1, y1) = segment
+    drawer.penup()
+    drawer.goto(-COLS * CELL_SIZE // 2 + x0 * CELL_SIZE, ROWS * CELL_SIZE // 2 - y0 * CELL_SIZE)
+    drawer.pendown()
+    drawer.goto(-COLS * CELL_SIZE // 2 + x1 * CELL_SIZE, ROWS * CELL_SIZE // 2 - y1 * CELL_SIZE)
 
+@timed("mohamad.draw_maze")
 def draw_maze():
     drawer.clear()
-    for y in range(ROWS):
-        for x in range(COLS):
-            draw_cell(x, y, maze[y][x])
+    # Each shared wall once, with straight runs merged into one line
+    for segment in wall_segments(maze, ROWS, COLS):
+        draw_wall(segment)
 
     # Open entrance and exit
     drawer.penup()
@@ -118,7 +105,7 @@ def update_player():
 def can_move(x, y, direction):
     if x < 0 or x >= COLS or y < 0 or y >= ROWS:
         return False
-    return maze[y][x][direction] == 0
+    return not has_wall(maze[y * COLS + x], direction)
 
 def check_win():
     global game_running
@@ -130,74 +117,33 @@ def check_win():
         message_writer.color("green")
         message_writer.write("🎉 You reached the exit! Congratulations! 🎉\nPress 'R' to restart", align="center", font=("Arial", 20, "bold"))
 
+@timed("mohamad.update_timer")
 def update_timer():
     if game_running:
         elapsed = int(time.time() - start_time)
-        timer_writer.clear()
-        timer_writer.write(f"Time: {elapsed}s", font=("Arial", 16, "bold"))
+        hud.set("timer", f"Time: {elapsed}s")
         screen.ontimer(update_timer, 1000)
 
 # --- Smooth movement ---
 
-def move_if_holding():
+def step(direction):
     global player_x, player_y
-    if not game_running:
+    if not game_running or not can_move(player_x, player_y, direction):
         return
-
-    moved = False
-    if held_direction == "up" and can_move(player_x, player_y, 0):
-        player_y -= 1
-        moved = True
-    elif held_direction == "right" and can_move(player_x, player_y, 1):
-        player_x += 1
-        moved = True
-    elif held_direction == "down" and can_move(player_x, player_y, 2):
-        player_y += 1
-        moved = True
-    elif held_direction == "left" and can_move(player_x, player_y, 3):
-        player_x -= 1
-        moved = True
-
-    if moved:
-        update_player()
-        check_win()
-
-    if held_direction:
-        screen.ontimer(move_if_holding, 100)  # reduced delay for smoother movement
-
-def hold_up():
-    global held_direction
-    held_direction = "up"
-    move_if_holding()
-
-def hold_right():
-    global held_direction
-    held_direction = "right"
-    move_if_holding()
-
-def hold_down():
-    global held_direction
-    held_direction = "down"
-    move_if_holding()
-
-def hold_left():
-    global held_direction
-    held_direction = "left"
-    move_if_holding()
-
-def release_key():
-    global held_direction
-    held_direction = None
+    dx, dy = DIRS[direction]
+    player_x += dx
+    player_y += dy
+    update_player()
+    check_win()
 
 def restart_game():
-    global maze, visited, player_x, player_y, start_time, game_running
+    global maze, player_x, player_y, start_time, game_running
 
     message_writer.clear()
-    timer_writer.clear()
+    hud.set("timer", "")
     drawer.clear()
 
-    maze = [[[1, 1, 1, 1] for _ in range(COLS)] for _ in range(ROWS)]
-    visited = [[False for _ in range(COLS)] for _ in range(ROWS)]
+    maze = new_wall_maze(ROWS, COLS)
     player_x, player_y = 0, 0
     game_running = True
     start_time = time.time()
@@ -209,21 +155,19 @@ def restart_game():
     update_timer()
 
 def main():
+    global start_time
+    setup_ui()
+    start_time = time.time()
     carve_maze(0, 0)
     draw_maze()
     update_player()
     update_timer()
 
+    # One 100 ms repeat timer, running only while a key is held
+    keys = KeyRepeat(screen, 100)
     screen.listen()
-    screen.onkeypress(hold_up, "w")
-    screen.onkeypress(hold_right, "d")
-    screen.onkeypress(hold_down, "s")
-    screen.onkeypress(hold_left, "a")
-
-    screen.onkeyrelease(release_key, "w")
-    screen.onkeyrelease(release_key, "a")
-    screen.onkeyrelease(release_key, "s")
-    screen.onkeyrelease(release_key, "d")
+    for key, direction in [("w", 0), ("d", 1), ("s", 2), ("a", 3)]:
+        keys.bind(key, lambda d=direction: step(d))
 
     screen.onkey(restart_game, "r")
 
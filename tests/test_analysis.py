@@ -0,0 +1,56 @@
+from maze_core.analysis import analyze, cached_analysis, rank
+
+RING = [[0, 0, 0],
+        [0, 1, 0],
+        [0, 0, 0]]
+
+TEE = [[0, 0, 0],
+       [1, 0, 1],
+       [1, 0, 1]]
+
+ISLAND = [[0, 0, 0, 1, 0],
+          [1, 0, 1, 1, 0],
+          [1, 0, 1, 1, 1]]
+
+
+def test_ring():
+    assert analyze(RING, (0, 0), (2, 2)) == {
+        "solution_length": 4, "dead_ends": 0, "junctions": 0, "branching": 0.0,
+        "loops": 1, "reachable_fraction": 1.0}
+
+
+def test_tee():
+    assert analyze(TEE, (0, 0), (2, 1)) == {
+        "solution_length": 3, "dead_ends": 1, "junctions": 1, "branching": 2.0,
+        "loops": 0, "reachable_fraction": 1.0}
+
+
+def test_unreachable_goal():
+    metrics = analyze(ISLAND, (0, 0), (0, 4))
+    assert metrics["solution_length"] == -1
+    assert metrics["reachable_fraction"] == 5 / 7
+    assert metrics["loops"] == 0
+
+
+def test_walled_start():
+    assert analyze(TEE, (1, 0), (2, 1))["solution_length"] == -1
+
+
+def test_wall_value():
+    inverted = [[1 - v for v in row] for row in TEE]
+    assert analyze(inverted, (0, 0), (2, 1), wall=0) == analyze(TEE, (0, 0), (2, 1))
+
+
+def test_cached_analysis(tmp_path):
+    first = cached_analysis("test", (3, 3), 1, RING, (0, 0), (2, 2), cache_dir=tmp_path)
+    # A hit comes from the cache, so it does not look at the grid again
+    again = cached_analysis("test", (3, 3), 1, TEE, (0, 0), (2, 1), cache_dir=tmp_path)
+    other = cached_analysis("test", (3, 3), 2, TEE, (0, 0), (2, 1), cache_dir=tmp_path)
+    assert first == again == analyze(RING, (0, 0), (2, 2))
+    assert other == analyze(TEE, (0, 0), (2, 1))
+
+
+def test_rank():
+    records = [{"id": i, "metrics": {"solution_length": n}} for i, n in enumerate([5, 9, 2, 7])]
+    assert [r["id"] for r in rank(records)] == [1, 3, 0, 2]
+    assert [r["id"] for r in rank(records, low=5, high=8)] == [3, 0]
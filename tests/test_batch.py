@@ -0,0 +1,40 @@
+import io
+import json
+
+from maze_core.batch import generate_job, save
+from maze_core.mazefile import MazeFile
+from maze_core.walls import ALL_WALLS, DIRS, has_wall, solve_wall_maze
+
+
+def test_mohamad_records_carry_a_solution():
+    for seed in range(10):
+        _, _, maze = generate_job(("mohamad", 8, seed))
+        solution, cells = maze["solution"], maze["cells"]
+        assert solution[0] == (0, 0) and solution[-1] == (7, 7)
+        for (r0, c0), (r1, c1) in zip(solution, solution[1:]):
+            direction = DIRS.index((c1 - c0, r1 - r0))
+            assert not has_wall(cells[r0 * 8 + c0], direction)
+
+
+def test_walled_off_exit_is_unsolvable():
+    maze = bytearray([ALL_WALLS]) * 4
+    maze[0] &= ~0b0010  # (0, 0) opens to the right
+    maze[1] &= ~0b1000
+    assert solve_wall_maze(maze, 2, 2, (0, 0), (0, 1)) == [(0, 0), (0, 1)]
+    assert solve_wall_maze(maze, 2, 2, (0, 0), (1, 1)) is None
+
+
+def test_saved_mohamad_cells_hold_only_walls(tmp_path):
+    _, _, maze = generate_job(("mohamad", 6, 3))
+    out = io.StringIO()
+    save(maze, tmp_path, "jsonl", out)
+    record = json.loads(out.getvalue())
+    cells = bytes.fromhex(record["cells"])
+    assert cells == bytes(cell & ALL_WALLS for cell in maze["cells"])
+    assert [tuple(cell) for cell in record["solution"]] == maze["solution"]
+
+    (tmp_path / "mohamad").mkdir()
+    save(maze, tmp_path, "binary", None)
+    with MazeFile(tmp_path / "mohamad" / "3.maze") as f:
+        assert f.wall_maze() == cells
+        assert f.solution() == maze["solution"]
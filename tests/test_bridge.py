@@ -0,0 +1,51 @@
+import random
+
+from maze_core import hassan
+from maze_core.carving import bridge_grid, carve_grid
+from maze_core.connectivity import grid_sets
+from maze_core.solver import bfs
+
+
+def open_cells(maze):
+    return [(r, c) for r, row in enumerate(maze) for c, v in enumerate(row) if v != 1]
+
+
+def is_tree(maze):
+    """The open cells are connected and hold no loop"""
+    cells = open_cells(maze)
+    edges = sum(maze[r + dr][c + dc] != 1 for r, c in cells for dr, dc in ((1, 0), (0, 1))
+                if r + dr < len(maze) and c + dc < len(maze[0]))
+    sets = grid_sets(maze)
+    cols = len(maze[0])
+    root = cells[0][0] * cols + cells[0][1]
+    return edges == len(cells) - 1 and all(sets.connected(root, r * cols + c) for r, c in cells)
+
+
+def test_bridge_reaches_walled_in_exit():
+    bridged = 0
+    for seed in range(40):
+        rows, cols = 21, 25
+        maze = [[1] * cols for _ in range(rows)]
+        maze[1][1] = 0
+        carve_grid(maze, (1, 1), early_break=0.6, rng=random.Random(seed))
+        walled = maze[rows - 2][cols - 2] == 1
+        opened = bridge_grid(maze, (rows - 2, cols - 2))
+        assert (opened > 0) == walled
+        bridged += walled
+        assert bfs(maze, (1, 1), (rows - 2, cols - 2)) is not None
+        assert is_tree(maze)
+    assert bridged
+
+
+def test_bridge_without_open_cells():
+    maze = [[1] * 5 for _ in range(5)]
+    assert bridge_grid(maze, (1, 1)) is None
+    assert maze == [[1] * 5 for _ in range(5)]
+
+
+def test_easy_mazes_are_solvable_and_perfect():
+    for seed in range(30):
+        maze, entrance = hassan.generate_easy_maze(15, 21, rng=random.Random(seed))
+        rows, cols = len(maze), len(maze[0])
+        assert bfs(maze, tuple(entrance), (rows - 2, cols - 1)) is not None
+        assert is_tree(maze)
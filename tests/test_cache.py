@@ -0,0 +1,71 @@
+import os
+
+from maze_core import cache
+
+GRID = [[1, 1, 1, 1],
+        [0, 0, 0, 1],
+        [1, 1, 0, 2],
+        [1, 1, 1, 1]]
+SOLUTION = [(1, 0), (1, 1), (1, 2), (2, 2), (2, 3)]
+
+
+def test_round_trip(tmp_path):
+    key = cache.cache_key("test", (4, 4), 1)
+    assert cache.load(key, tmp_path) is None
+    cache.store(key, GRID, SOLUTION, tmp_path)
+    grid, solution = cache.load(key, tmp_path)
+    assert [list(row) for row in grid] == GRID
+    assert [tuple(cell) for cell in solution] == SOLUTION
+
+
+def test_keys_differ_by_every_part():
+    keys = {cache.cache_key("a", (4, 4), 1), cache.cache_key("b", (4, 4), 1),
+            cache.cache_key("a", (4, 5), 1), cache.cache_key("a", (4, 4), 2),
+            cache.cache_key("a", (4, 4), 1, version=2)}
+    assert len(keys) == 5
+
+
+def test_corrupt_entries_are_misses(tmp_path):
+    key = cache.cache_key("test", (4, 4), 1)
+    cache.store(key, GRID, SOLUTION, tmp_path)
+    path = cache._path(key, tmp_path)
+    for junk in (b"", b"MAZE", os.urandom(200)):
+        with open(path, "wb") as f:
+            f.write(junk)
+        assert cache.load(key, tmp_path) is None
+    with open(cache._metrics_path(key, tmp_path), "w") as f:
+        f.write("{not json")
+    assert cache.load_metrics(key, tmp_path) is None
+
+
+def test_cached_builds_once(tmp_path):
+    builds = []
+
+    def build():
+        builds.append(1)
+        return GRID, SOLUTION
+
+    for _ in range(3):
+        grid, _ = cache.cached("test", (4, 4), 5, build, tmp_path)
+        assert [list(row) for row in grid] == GRID
+    assert len(builds) == 1
+
+
+def test_prune_deletes_least_recently_used(tmp_path):
+    keys = [cache.cache_key("test", (4, 4), seed) for seed in range(4)]
+    for age, key in enumerate(keys):
+        cache.store(key, GRID, SOLUTION, tmp_path)
+        os.utime(cache._path(key, tmp_path), (age, age))
+    cache.load(keys[0], tmp_path)  # now the most recently used
+    size = os.path.getsize(cache._path(keys[0], tmp_path))
+    cache.prune(tmp_path, max_bytes=2 * size)
+    assert [cache.load(key, tmp_path) is not None for key in keys] == [True, False, False, True]
+
+
+def test_prune_runs_every_few_stores(tmp_path, monkeypatch):
+    pruned = []
+    monkeypatch.setattr(cache, "prune", lambda root: pruned.append(root))
+    monkeypatch.setattr(cache, "PRUNE_EVERY", 3)
+    for seed in range(7):
+        cache.store(cache.cache_key("test", (4, 4), seed), GRID, SOLUTION, tmp_path)
+    assert pruned == [tmp_path] * 3
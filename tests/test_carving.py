@@ -0,0 +1,67 @@
+import random
+import sys
+
+import pytest
+
+from maze_core.carving import carve_grid
+from maze_core.walls import DIRS, carve_wall_maze, has_wall, new_wall_maze
+
+
+def recursive_carve(maze, r, c, rng, early_break=0.0):
+    """The generators' carve() before the explicit stack, for comparison"""
+    rows, cols = len(maze), len(maze[0])
+    directions = [(-2, 0), (2, 0), (0, -2), (0, 2)]
+    rng.shuffle(directions)
+    for dr, dc in directions:
+        nr, nc = r + dr, c + dc
+        if 0 < nr < rows and 0 < nc < cols and maze[nr][nc] == 1:
+            maze[nr][nc] = 0
+            maze[r + dr // 2][c + dc // 2] = 0
+            recursive_carve(maze, nr, nc, rng, early_break)
+            if early_break and rng.random() < early_break:
+                break
+
+
+def recursive_wall_carve(walls, visited, x, y, rows, cols, rng):
+    """mohamad's carve_maze() before the packed cells"""
+    visited[y][x] = True
+    directions = list(enumerate(DIRS))
+    rng.shuffle(directions)
+    for i, (dx, dy) in directions:
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < cols and 0 <= ny < rows and not visited[ny][nx]:
+            walls[y][x][i] = 0
+            walls[ny][nx][(i + 2) % 4] = 0
+            recursive_wall_carve(walls, visited, nx, ny, rows, cols, rng)
+
+
+@pytest.mark.parametrize("early_break", [0.0, 0.4])
+def test_grid_carve_matches_recursive(early_break):
+    for seed in range(20):
+        expected = [[1] * 21 for _ in range(15)]
+        expected[1][1] = 0
+        recursive_carve(expected, 1, 1, random.Random(seed), early_break)
+        maze = [[1] * 21 for _ in range(15)]
+        maze[1][1] = 0
+        carve_grid(maze, (1, 1), early_break, random.Random(seed))
+        assert maze == expected
+
+
+def test_wall_carve_matches_recursive():
+    rows, cols = 8, 11
+    for seed in range(20):
+        walls = [[[1, 1, 1, 1] for _ in range(cols)] for _ in range(rows)]
+        visited = [[False] * cols for _ in range(rows)]
+        recursive_wall_carve(walls, visited, 0, 0, rows, cols, random.Random(seed))
+        maze = new_wall_maze(rows, cols)
+        carve_wall_maze(maze, rows, cols, 0, 0, random.Random(seed))
+        assert [[[has_wall(maze[y * cols + x], d) for d in range(4)]
+                 for x in range(cols)] for y in range(rows)] == walls
+
+
+def test_no_recursion_limit():
+    size = 2 * sys.getrecursionlimit() + 1
+    maze = [[1] * size for _ in range(3)]
+    maze[1][1] = 0
+    carve_grid(maze, (1, 1), rng=random.Random(0))
+    assert all(v == 0 for v in maze[1][1:-1])
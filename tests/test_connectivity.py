@@ -0,0 +1,60 @@
+import random
+
+from maze_core import hassan
+from maze_core.carving import carve_grid
+from maze_core.connectivity import DisjointSet, grid_sets
+from maze_core.solver import bfs
+
+
+def test_disjoint_set():
+    sets = DisjointSet(6)
+    assert sets.union(0, 1) and sets.union(2, 3) and sets.union(1, 3)
+    assert not sets.union(0, 2)
+    assert sets.connected(0, 3) and not sets.connected(0, 4)
+
+
+def test_grid_sets():
+    grid = [[0, 0, 1, 0],
+            [1, 0, 1, 0],
+            [0, 0, 1, 0]]
+    sets = grid_sets(grid)
+    assert sets.connected(0, 8) and sets.connected(3, 11)
+    assert not sets.connected(0, 3)
+
+
+def solution_length(maze):
+    rows, cols = len(maze), len(maze[0])
+    return len(bfs(maze, (1, 0), (rows - 2, cols - 1))) - 1
+
+
+def test_hard_mazes_have_loops_but_keep_long_routes():
+    lengths = {}
+    for difficulty, size in (("easy", 11), ("medium", 21), ("hard", 31)):
+        generate = getattr(hassan, f"generate_{difficulty}_maze")
+        lengths[difficulty] = []
+        for seed in range(20):
+            maze, start = generate(size, size, rng=random.Random(seed))
+            assert start == [1, 0]
+            lengths[difficulty].append(solution_length(maze))
+            if difficulty == "hard":
+                cells = [(r, c) for r in range(size) for c in range(size) if maze[r][c] != 1]
+                edges = sum(1 for r, c in cells for nr, nc in ((r + 1, c), (r, c + 1))
+                            if nr < size and nc < size and maze[nr][nc] != 1)
+                assert edges > len(cells) - 1  # loops were added
+    mean = {d: sum(v) / len(v) for d, v in lengths.items()}
+    assert mean["hard"] >= mean["medium"] >= mean["easy"]
+
+
+def test_hard_loops_never_shorten_the_route():
+    # Carving uses the rng before the loop pass, so the same seed rebuilds
+    # the loop-free maze the loops were added to
+    for seed in range(10):
+        maze, _ = hassan.generate_hard_maze(31, 31, rng=random.Random(seed))
+        rng = random.Random(seed)
+        tree = [[1] * 31 for _ in range(31)]
+        for r, c in [(1, 1), (1, 29), (29, 1), (29, 29)]:
+            if tree[r][c] == 1:
+                tree[r][c] = 0
+                carve_grid(tree, (r, c), rng=rng)
+        tree[1][0], tree[29][30] = 0, 2
+        assert solution_length(maze) == solution_length(tree)
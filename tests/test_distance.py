@@ -0,0 +1,75 @@
+import random
+from collections import deque
+
+from maze_core.distance import distance_field, next_step, path_to_goal
+
+
+def bfs_distances(grid, goal, wall):
+    rows, cols = len(grid), len(grid[0])
+    dist = {goal: 0}
+    queue = deque([goal])
+    while queue:
+        r, c = queue.popleft()
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if (0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] != wall
+                    and (nr, nc) not in dist):
+                dist[nr, nc] = dist[r, c] + 1
+                queue.append((nr, nc))
+    return dist
+
+
+def random_grid(seed, rows=13, cols=17):
+    rng = random.Random(seed)
+    grid = [[1 if rng.random() < 0.35 else 0 for _ in range(cols)] for _ in range(rows)]
+    grid[0][0] = 0
+    return grid
+
+
+def test_matches_bfs():
+    for seed in range(20):
+        grid = random_grid(seed)
+        rows, cols = len(grid), len(grid[0])
+        expected = bfs_distances(grid, (0, 0), 1)
+        dist = distance_field(grid, (0, 0))
+        for r in range(rows):
+            for c in range(cols):
+                assert dist[r * cols + c] == expected.get((r, c), -1)
+
+
+def test_wall_value():
+    grid = [[0, 0, 0], [1, 1, 0], [0, 0, 0]]
+    inverted = [[1 - v for v in row] for row in grid]
+    assert list(distance_field(inverted, (0, 0), wall=0)) == list(distance_field(grid, (0, 0)))
+
+
+def test_does_not_wrap_rows():
+    # (0, 2) and (1, 0) are next to each other in the flat array only
+    grid = [[0, 1, 0],
+            [0, 1, 1]]
+    dist = distance_field(grid, (1, 0))
+    assert list(dist) == [1, -1, -1, 0, -1, -1]
+
+
+def test_path_to_goal():
+    for seed in range(20):
+        grid = random_grid(seed)
+        rows, cols = len(grid), len(grid[0])
+        dist = distance_field(grid, (0, 0))
+        for r in range(rows):
+            for c in range(cols):
+                path = path_to_goal(dist, rows, cols, (r, c))
+                d = dist[r * cols + c]
+                if d < 0:
+                    assert path == []
+                    continue
+                assert len(path) == d + 1
+                assert path[0] == (r, c) and path[-1] == (0, 0)
+                for (ar, ac), (br, bc) in zip(path, path[1:]):
+                    assert abs(ar - br) + abs(ac - bc) == 1 and grid[br][bc] == 0
+
+
+def test_next_step_at_goal_or_unreachable():
+    grid = [[0, 1, 0]]
+    dist = distance_field(grid, (0, 0))
+    assert next_step(dist, 1, 3, (0, 0)) is None
+    assert next_step(dist, 1, 3, (0, 2)) is None
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from maze_core import hassan, hicham
+from maze_core.distance import distance_field
+from maze_core.grid import count_neighbours, new_grid, row_views, to_array
+from maze_core.solver import SOLVERS, flatten
+
+np = pytest.importorskip("numpy")
+
+
+def test_row_views_write_through():
+    grid = new_grid(3, 4, 1, as_array=True)
+    rows = row_views(grid)
+    rows[1][2] = 0
+    assert grid.tolist() == [[1] * 4, [1, 1, 0, 1], [1] * 4]
+    assert rows[1][2] == 0 and rows[0][0] == 1
+    lists = new_grid(3, 4, 1)
+    assert row_views(lists) is lists and lists == [[1] * 4] * 3
+
+
+def test_count_neighbours():
+    rng = random.Random(4)
+    rows = [[rng.randrange(2) for _ in range(9)] for _ in range(7)]
+    for diagonal in (True, False):
+        assert count_neighbours(to_array(rows), 0, diagonal).tolist() == \
+            count_neighbours(rows, 0, diagonal)
+
+
+@pytest.mark.parametrize("name", ["easy", "medium", "hard"])
+def test_hassan_arrays_match_lists(name):
+    generate = getattr(hassan, f"generate_{name}_maze")
+    for seed in range(5):
+        rows, _ = generate(21, 25, rng=random.Random(seed))
+        grid, _ = generate(21, 25, as_array=True, rng=random.Random(seed))
+        assert isinstance(grid, np.ndarray) and grid.dtype == np.uint8
+        assert grid.tolist() == rows
+
+
+def test_hicham_arrays_match_lists():
+    for seed in range(5):
+        rows, solution = hicham.generate_level(23, 21, random.Random(seed))
+        grid, array_solution = hicham.generate_level(23, 21, random.Random(seed), as_array=True)
+        assert isinstance(grid, np.ndarray)
+        assert grid.tolist() == rows and array_solution == solution
+
+
+def test_solvers_accept_arrays():
+    rows, _ = hassan.generate_hard_maze(31, 31, rng=random.Random(2))
+    grid = to_array(rows)
+    assert flatten(grid) == flatten(rows)
+    assert list(distance_field(grid, (29, 30))) == list(distance_field(rows, (29, 30)))
+    for solve in SOLVERS.values():
+        assert solve(grid, (1, 0), (29, 30)) == solve(rows, (1, 0), (29, 30))
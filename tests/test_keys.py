@@ -0,0 +1,98 @@
+import heapq
+import itertools
+
+import pytest
+
+from maze_core.keys import KeyRepeat
+
+INTERVAL = 34
+
+
+class Screen:
+    """Runs timers on a virtual millisecond clock"""
+
+    def __init__(self):
+        self.now = 0
+        self.queue = []
+        self.order = itertools.count()
+        self.presses = {}
+        self.releases = {}
+
+    def onkeypress(self, fun, key):
+        self.presses[key] = fun
+
+    def onkeyrelease(self, fun, key):
+        self.releases[key] = fun
+
+    def ontimer(self, fun, ms):
+        self.at(self.now + ms, fun)
+
+    def at(self, ms, fun):
+        heapq.heappush(self.queue, (ms, next(self.order), fun))
+
+    def run(self):
+        while self.queue:
+            self.now, _, fun = heapq.heappop(self.queue)
+            fun()
+
+
+def play(keys, repeat=None):
+    """Actions run for keys pressed as (key, down at, held for) in ms
+
+    repeat imitates the platform's auto-repeat while a key is held:
+    "windows" sends extra presses, "x11" release/press pairs that share
+    a timestamp.
+    """
+    screen = Screen()
+    actions = []
+    repeater = KeyRepeat(screen, INTERVAL)
+    for key in "ab":
+        repeater.bind(key, lambda key=key: actions.append((key, screen.now)))
+    for key, down, held in keys:
+        screen.at(down, lambda key=key: screen.presses[key]())
+        for t in range(down + 500, down + held, 33) if repeat else ():
+            if repeat == "x11":
+                screen.at(t, lambda key=key: screen.releases[key]())
+            screen.at(t, lambda key=key: screen.presses[key]())
+        screen.at(down + held, lambda key=key: screen.releases[key]())
+    screen.run()
+    return actions
+
+
+@pytest.mark.parametrize("held", [5, 40, 120, 240])
+def test_tap_is_one_action(held):
+    assert play([("a", 0, held)]) == [("a", 0)]
+
+
+def test_hold_repeats_after_the_delay():
+    times = [t for _, t in play([("a", 0, 1000)])]
+    assert times == [0] + list(range(250, 1001, INTERVAL))
+
+
+@pytest.mark.parametrize("repeat", ["windows", "x11"])
+def test_platform_auto_repeat_is_ignored(repeat):
+    assert play([("a", 0, 1000)], repeat) == play([("a", 0, 1000)])
+
+
+def test_latest_key_wins():
+    actions = play([("a", 0, 1000), ("b", 400, 300)])
+    keys = [key for key, t in actions]
+    assert keys[0] == "a" and ("b", 400) in actions
+    assert {key for key, t in actions if 400 <= t < 700} == {"b"}
+    assert {key for key, t in actions if t > 730} == {"a"}
+
+
+def test_quick_alternating_taps():
+    taps = [("ab"[i % 2], i * 125, 60) for i in range(8)]
+    assert play(taps) == [(key, down) for key, down, _ in taps]
+
+
+def test_stop_unbinds_and_winds_down():
+    screen = Screen()
+    actions = []
+    repeater = KeyRepeat(screen, INTERVAL)
+    repeater.bind("a", lambda: actions.append(screen.now))
+    screen.presses["a"]()
+    screen.at(300, repeater.stop)
+    screen.run()
+    assert actions == [0, 250, 284] and screen.presses["a"] is None
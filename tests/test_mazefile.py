@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from maze_core.hassan import build_maze
+from maze_core.mazefile import MazeFile, write_maze, write_wall_maze
+from maze_core.streaming import stream_grid, write_streamed
+from maze_core.walls import ALL_WALLS, carve_wall_maze, new_wall_maze
+
+
+@pytest.mark.parametrize("difficulty", ["Easy", "Medium", "Hard"])
+def test_grid_round_trip(tmp_path, difficulty):
+    grid, solution = build_maze(difficulty, 21, 21, 5, use_cache=False)
+    path = tmp_path / "maze.maze"
+    write_maze(path, grid, "hassan." + difficulty, 5, solution)
+    with MazeFile(path) as f:
+        assert f.grid() == grid
+        assert f.solution() == solution
+        assert (f.rows, f.cols, f.seed) == (len(grid), len(grid[0]), 5)
+        assert f.generator == "hassan." + difficulty
+        assert f.cell(len(grid) - 2, len(grid[0]) - 1) == 2
+
+
+@pytest.mark.parametrize("bits_value", [1, 3, 15, 255])
+def test_cell_widths(tmp_path, bits_value):
+    rng = random.Random(bits_value)
+    grid = [[rng.randint(0, bits_value) for _ in range(13)] for _ in range(7)]
+    write_maze(tmp_path / "m.maze", grid)
+    with MazeFile(tmp_path / "m.maze") as f:
+        assert list(f) == grid
+        assert f.seed is None and f.solution() is None
+
+
+@pytest.mark.parametrize("seed", [0, -3, 2 ** 40])
+def test_wall_round_trip(tmp_path, seed):
+    rows, cols = 9, 14
+    maze = new_wall_maze(rows, cols)
+    carve_wall_maze(maze, rows, cols, 0, 0, random.Random(seed))
+    write_wall_maze(tmp_path / "w.maze", maze, rows, cols, "mohamad", seed)
+    with MazeFile(tmp_path / "w.maze") as f:
+        assert f.wall_maze() == bytearray(cell & ALL_WALLS for cell in maze)
+        assert f.seed == seed
+
+
+def test_streamed_file_matches_stream(tmp_path):
+    write_streamed(tmp_path / "s.maze", 41, 61, seed=9)
+    with MazeFile(tmp_path / "s.maze") as f:
+        assert f.grid() == list(stream_grid(41, 61, random.Random(9)))
+
+
+def test_rejects_other_files(tmp_path):
+    (tmp_path / "junk.maze").write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        MazeFile(tmp_path / "junk.maze")
+
+
+@pytest.mark.parametrize("keep", [0, 10, 50, 60, -1])
+def test_rejects_truncated_files(tmp_path, keep):
+    grid, solution = build_maze("Medium", 21, 21, 1, use_cache=False)
+    write_maze(tmp_path / "m.maze", grid, "hassan.Medium", 1, solution)
+    data = (tmp_path / "m.maze").read_bytes()
+    (tmp_path / "cut.maze").write_bytes(data[:keep])
+    with pytest.raises(ValueError):
+        MazeFile(tmp_path / "cut.maze")
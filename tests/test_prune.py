@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from maze_core.hicham import prune_wall_clusters
+
+DELTAS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def rescan_prune(grid, max_adjacent, rng):
+    """The old prune: rescan the whole grid until nothing changes"""
+    H, W = len(grid), len(grid[0])
+    changed = True
+    while changed:
+        changed = False
+        for y in range(H):
+            for x in range(W):
+                if grid[y][x] != 0:
+                    continue
+                nbrs = [(y + dy, x + dx) for dy, dx in DELTAS
+                        if 0 <= y + dy < H and 0 <= x + dx < W and grid[y + dy][x + dx] == 0]
+                if len(nbrs) > max_adjacent:
+                    ry, rx = rng.choice(nbrs)
+                    grid[ry][rx] = 1
+                    changed = True
+
+
+def walled_grid(seed, h=23, w=31, density=0.7):
+    rng = random.Random(seed)
+    return [[0 if rng.random() < density else 1 for _ in range(w)] for _ in range(h)]
+
+
+def crowded(grid, max_adjacent):
+    H, W = len(grid), len(grid[0])
+    return [(y, x) for y in range(H) for x in range(W) if grid[y][x] == 0
+            and sum(0 <= y + dy < H and 0 <= x + dx < W and grid[y + dy][x + dx] == 0
+                    for dy, dx in DELTAS) > max_adjacent]
+
+
+@pytest.mark.parametrize("max_adjacent", [2, 4, 6])
+def test_matches_full_rescan(max_adjacent):
+    for seed in range(15):
+        expected = walled_grid(seed)
+        rescan_prune(expected, max_adjacent, random.Random(seed))
+        grid = walled_grid(seed)
+        prune_wall_clusters(grid, max_adjacent, random.Random(seed))
+        assert grid == expected
+        assert crowded(grid, max_adjacent) == []
+
+
+def test_arrays_match_lists():
+    np = pytest.importorskip("numpy")
+    for seed in range(10):
+        rows = walled_grid(seed)
+        prune_wall_clusters(rows, 4, random.Random(seed))
+        grid = np.array(walled_grid(seed), dtype=np.uint8)
+        prune_wall_clusters(grid, 4, random.Random(seed))
+        assert grid.tolist() == rows
@@ -0,0 +1,65 @@
+import tkinter
+
+import pytest
+
+from maze_core.raster import RASTER_THRESHOLD, choose_backend, draw_raster_outlines
+
+
+class PhotoImage:
+    def __init__(self, master=None, width=0, height=0):
+        self.width, self.height = width, height
+        self.pixels = {}
+
+    def put(self, color, to):
+        x0, y0, x1, y1 = to
+        assert 0 <= x0 <= x1 <= self.width and 0 <= y0 <= y1 <= self.height
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                self.pixels[x, y] = color
+
+
+class Canvas:
+    def create_image(self, x, y, image, anchor):
+        self.placed = (x, y, anchor)
+        return 7
+
+
+class Turtle:
+    def __init__(self):
+        self.items = []
+        self.canvas = Canvas()
+
+    def getscreen(self):
+        return self
+
+    def getcanvas(self):
+        return self.canvas
+
+
+def test_choose_backend():
+    side = int(RASTER_THRESHOLD ** 0.5)
+    assert choose_backend("auto", side, side) == "vector"
+    assert choose_backend("auto", side + 1, side) == "raster"
+    assert choose_backend("vector", 10 ** 6, 10 ** 6) == "vector"
+    with pytest.raises(ValueError):
+        choose_backend("svg", 10, 10)
+
+
+def test_outlines_match_the_vector_edges(monkeypatch):
+    monkeypatch.setattr(tkinter, "PhotoImage", PhotoImage)
+    t = Turtle()
+    grid = [[0, 1, 1],
+            [1, 1, 0]]
+    image = draw_raster_outlines(t, grid, 0, 10, -15, 20)
+    assert (image.width, image.height) == (30, 20)
+    assert t.items == [7] and t.raster_image is image
+    assert t.canvas.placed == (-15, -20, "nw")
+    black = {p for p, color in image.pixels.items() if color == "black"}
+    # 2 px lines centred on the edges of the two wall cells, clipped to the image
+    expected = set()
+    for cx, cy in ((0, 0), (2, 1)):
+        x0, y0, x1, y1 = cx * 10, cy * 10, cx * 10 + 10, cy * 10 + 10
+        expected |= {(x, y) for x in range(x0 - 1, x1 + 1) for y in range(y0 - 1, y1 + 1)
+                     if 0 <= x < 30 and 0 <= y < 20
+                     and not (x0 + 1 <= x < x1 - 1 and y0 + 1 <= y < y1 - 1)}
+    assert black == expected
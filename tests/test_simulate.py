@@ -0,0 +1,56 @@
+import functools
+
+from maze_core.hicham import IDEAL_BONUS, STARTING_SCORE
+from maze_core.simulate import (add_run, new_stats, optimal, play_level, play_run,
+                                random_walk, run_job, wall_follower)
+
+SMALL = dict(max_levels=4, initial=(7, 7), increment=2)
+
+
+def test_optimal_bot_plays_ideally():
+    levels = play_run(3, optimal, **SMALL)
+    assert len(levels) == 4
+    for level, (ideal_moves, moves, total_score) in enumerate(levels, 1):
+        assert moves == ideal_moves
+        assert total_score == STARTING_SCORE + level * IDEAL_BONUS
+
+
+def test_wall_follower_reaches_the_goal():
+    # Levels are perfect mazes, so the right hand always gets there
+    for ideal_moves, moves, total_score in play_run(5, wall_follower, starting_score=10 ** 6,
+                                                    **SMALL):
+        assert moves >= ideal_moves and total_score > 0
+
+
+def test_lost_level_stops_at_the_budget():
+    levels = play_run(1, random_walk, starting_score=1, max_levels=30)
+    ideal_moves, moves, total_score = levels[-1]
+    assert total_score <= 0
+    before = levels[-2][2] if len(levels) > 1 else 1
+    assert moves == ideal_moves + before
+
+
+def test_runs_replay():
+    noisy = functools.partial(optimal, noise=0.3)
+    mazes = {}
+    first = play_run(7, noisy, mazes=mazes, **SMALL)
+    assert play_run(7, noisy, mazes=mazes, **SMALL) == first
+    assert play_run(7, noisy, **SMALL) == first
+
+
+def test_play_level_scores_extra_moves():
+    grid = [[1, 1, 1],
+            [0, 0, 1],
+            [1, 1, 1]]
+    solution = [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+    assert play_level(grid, solution, 5, optimal, None) == (6, 5 + IDEAL_BONUS)
+
+
+def test_run_job_and_stats():
+    configs = [("optimal", 0.0, 20, 2, 3), ("random", 0.0, 1, 2, 3)]
+    results = run_job(configs, 11)
+    assert [config for config, _ in results] == configs
+    stats = new_stats()
+    add_run(stats, results[0][1])
+    assert stats["runs"] == 1 and stats["cleared"] == [3]
+    assert stats["ideal"] == {1: 1, 2: 1, 3: 1}
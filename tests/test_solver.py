@@ -0,0 +1,96 @@
+import random
+from collections import deque
+
+import pytest
+
+from maze_core.carving import carve_grid
+from maze_core.solver import SOLVERS, solve_many
+
+
+def reference_length(grid, start, goal, wall=1):
+    """Moves on the shortest route by a plain BFS, or None"""
+    rows, cols = len(grid), len(grid[0])
+    if grid[start[0]][start[1]] == wall or grid[goal[0]][goal[1]] == wall:
+        return None
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        r, c = queue.popleft()
+        if (r, c) == goal:
+            return dist[goal]
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if (0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] != wall
+                    and (nr, nc) not in dist):
+                dist[nr, nc] = dist[r, c] + 1
+                queue.append((nr, nc))
+    return None
+
+
+def assert_route(grid, path, start, goal, wall=1):
+    assert path[0] == start and path[-1] == goal
+    for (r0, c0), (r1, c1) in zip(path, path[1:]):
+        assert abs(r0 - r1) + abs(c0 - c1) == 1
+        assert grid[r1][c1] != wall
+
+
+def perfect_maze(size, seed, loops=0):
+    rng = random.Random(seed)
+    grid = [[1] * size for _ in range(size)]
+    grid[1][1] = 0
+    carve_grid(grid, (1, 1), rng=rng)
+    for _ in range(loops):
+        grid[rng.randrange(1, size - 1)][rng.randrange(1, size - 1)] = 0
+    return grid
+
+
+def noise_grid(size, seed, density=0.35):
+    rng = random.Random(seed)
+    grid = [[int(rng.random() < density) for _ in range(size)] for _ in range(size)]
+    grid[0][0] = grid[-1][-1] = 0
+    return grid
+
+
+CASES = ([(perfect_maze(31, seed), (1, 1), (29, 29)) for seed in range(5)]
+         + [(perfect_maze(31, seed, loops=40), (1, 1), (29, 29)) for seed in range(5)]
+         + [(noise_grid(25, seed), (0, 0), (24, 24)) for seed in range(20)])
+
+
+@pytest.mark.parametrize("method", sorted(SOLVERS))
+def test_matches_reference_bfs(method):
+    solve = SOLVERS[method]
+    for grid, start, goal in CASES:
+        expected = reference_length(grid, start, goal)
+        path = solve(grid, start, goal)
+        if expected is None:
+            assert path is None
+        else:
+            assert len(path) - 1 == expected
+            assert_route(grid, path, start, goal)
+
+
+@pytest.mark.parametrize("method", sorted(SOLVERS))
+def test_unreachable_and_walls(method):
+    solve = SOLVERS[method]
+    split = [[0, 0, 1, 0, 0]] * 3
+    assert solve(split, (0, 0), (2, 4)) is None
+    assert solve(split, (0, 0), (1, 2)) is None  # goal on a wall
+    assert solve(split, (1, 2), (0, 0)) is None  # start on a wall
+
+
+@pytest.mark.parametrize("method", sorted(SOLVERS))
+def test_start_is_goal(method):
+    grid = perfect_maze(11, 3)
+    assert SOLVERS[method](grid, (1, 1), (1, 1)) == [(1, 1)]
+
+
+@pytest.mark.parametrize("method", sorted(SOLVERS))
+def test_custom_wall_value(method):
+    # hicham's grids: 0 is wall, 1 is path
+    grid = [[1 - v for v in row] for row in perfect_maze(21, 7)]
+    path = SOLVERS[method](grid, (1, 1), (19, 19), wall=0)
+    assert len(path) - 1 == reference_length(grid, (1, 1), (19, 19), wall=0)
+
+
+def test_solve_many_keeps_order():
+    jobs = [(grid, start, goal) for grid, start, goal in CASES[:6]]
+    assert solve_many(jobs, "astar") == [SOLVERS["astar"](*job) for job in jobs]
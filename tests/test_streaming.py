@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from maze_core.connectivity import DisjointSet, grid_sets
+from maze_core.streaming import stream_grid, stream_wall_rows
+from maze_core.walls import DIRS, has_wall
+
+
+@pytest.mark.parametrize("rows, cols", [(3, 3), (21, 21), (41, 17), (20, 30)])
+def test_grid_is_perfect(rows, cols):
+    for seed in range(5):
+        grid = list(stream_grid(rows, cols, random.Random(seed)))
+        height, width = len(grid), len(grid[0])
+        assert (height, width) == (rows | 1, cols | 1)
+        assert grid[1][0] == 0 and grid[height - 2][width - 1] == 2
+        cells = [(r, c) for r in range(height) for c in range(width) if grid[r][c] != 1]
+        edges = sum(1 for r, c in cells for nr, nc in ((r + 1, c), (r, c + 1))
+                    if nr < height and nc < width and grid[nr][nc] != 1)
+        # Connected with one edge fewer than cells: a tree, so no loops
+        sets = grid_sets(grid)
+        roots = {sets.find(r * width + c) for r, c in cells}
+        assert len(roots) == 1
+        assert edges == len(cells) - 1
+
+
+@pytest.mark.parametrize("rows, cols", [(1, 1), (1, 12), (10, 10), (25, 7)])
+def test_wall_rows_are_perfect(rows, cols):
+    for seed in range(5):
+        maze = b"".join(stream_wall_rows(rows, cols, random.Random(seed)))
+        sets = DisjointSet(rows * cols)
+        passages = 0
+        for y in range(rows):
+            for x in range(cols):
+                cell = maze[y * cols + x]
+                for d, (dx, dy) in enumerate(DIRS):
+                    nx, ny = x + dx, y + dy
+                    inside = 0 <= nx < cols and 0 <= ny < rows
+                    if not inside:
+                        assert has_wall(cell, d)
+                        continue
+                    # Both sides of a wall agree
+                    assert has_wall(cell, d) == has_wall(maze[ny * cols + nx], (d + 2) % 4)
+                    if d in (1, 2) and not has_wall(cell, d):
+                        passages += 1
+                        assert sets.union(y * cols + x, ny * cols + nx)  # no loop
+        assert passages == rows * cols - 1
@@ -0,0 +1,116 @@
+import pytest
+
+from maze_core import tween
+from maze_core.tween import Tweener
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Screen:
+    def __init__(self, clock):
+        self.clock = clock
+        self.timers = []
+        self.updates = 0
+
+    def ontimer(self, fun, ms):
+        self.timers.append((fun, ms))
+
+    def update(self):
+        self.updates += 1
+
+    def run(self, frames, ms=10):
+        """Run pending timers, frames times, ms apart"""
+        for _ in range(frames):
+            if not self.timers:
+                return
+            fun, _ = self.timers.pop(0)
+            self.clock.now += ms / 1000
+            fun()
+
+
+class Turtle:
+    def __init__(self, x=0.0, y=0.0):
+        self.x, self.y = x, y
+
+    def xcor(self):
+        return self.x
+
+    def ycor(self):
+        return self.y
+
+    def goto(self, x, y):
+        self.x, self.y = x, y
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(tween.time, "perf_counter", clock)
+    return Screen(clock)
+
+
+def test_glides_at_speed(screen):
+    tweener = Tweener(screen, speed=1000)
+    t = Turtle()
+    arrived = []
+    tweener.move(t, (50, 0), lambda: arrived.append(True))
+    screen.run(1)
+    assert (t.x, t.y) == pytest.approx((10, 0))
+    assert not arrived and tweener.pending(t) == 1
+    screen.run(10)
+    assert (t.x, t.y) == (50, 0) and arrived == [True]
+    assert not tweener.running and not screen.timers
+
+
+def test_queued_moves_share_the_frame_budget(screen):
+    tweener = Tweener(screen, speed=1000)
+    t = Turtle()
+    tweener.move(t, (6, 0))
+    tweener.move(t, (6, 8))
+    assert tweener.pending(t) == 2
+    screen.run(1)
+    assert (t.x, t.y) == pytest.approx((6, 4))
+    assert tweener.pending(t) == 1
+    assert len(screen.timers) == 1
+
+
+def test_late_frames_keep_the_pace_but_stalls_are_capped(screen):
+    tweener = Tweener(screen, speed=100)
+    t = Turtle()
+    tweener.move(t, (1000, 0))
+    screen.run(1, ms=50)
+    assert t.x == pytest.approx(5)
+    screen.run(1, ms=5000)
+    assert t.x == pytest.approx(15)
+
+
+def test_moving_target(screen):
+    tweener = Tweener(screen, speed=1000)
+    t = Turtle()
+    goal = [100, 0]
+    tweener.move(t, lambda: tuple(goal))
+    screen.run(1)
+    goal[1] = 100
+    screen.run(100)
+    assert (t.x, t.y) == (100, 100)
+
+
+def test_cancel_stops_in_place(screen):
+    tweener = Tweener(screen, speed=1000)
+    a, b = Turtle(), Turtle()
+    tweener.move(a, (100, 0))
+    tweener.move(b, (0, 100))
+    screen.run(1)
+    tweener.cancel(a)
+    screen.run(100)
+    assert a.x == pytest.approx(10) and b.y == 100
+    tweener.move(a, (20, 0))
+    tweener.cancel()
+    screen.run(100)
+    assert a.x == pytest.approx(10)